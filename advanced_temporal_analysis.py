@@ -11,12 +11,22 @@ Date: 2025-07-25
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal, fft
-from scipy.optimize import minimize
-import seaborn as sns
-from typing import List, Dict, Tuple
-import pandas as pd
+from typing import List, Dict, Iterator, Sequence, Tuple
+
+from known_zeros import FIRST_KNOWN_ZEROS
+
+# عدد الأعداد في كل كتلة من تحليل الرنين (~41 ميغابايت من جدول الخصائص المؤقت)
+RESONANCE_CHUNK = 2**20
+
+# أعمدة analyze_number_resonance وحقول TemporalNumberSystem.properties المقابلة
+RESONANCE_COLUMNS = {
+    'numbers': 'n',
+    'birth_times': 'birth_time',
+    'frequencies': 'natural_frequency',
+    'resistances': 'resistance',
+    'quality_factors': 'quality_factor',
+    'is_prime': 'is_prime',
+}
 
 class AdvancedTemporalAnalysis:
     """التحليل المتقدم للنموذج الزمني"""
@@ -25,49 +35,89 @@ class AdvancedTemporalAnalysis:
         self.solver = solver
         self.ns = solver.number_system
         
-    def analyze_number_resonance(self, n_max: int = 100) -> Dict:
-        """تحليل رنين الأعداد"""
-        numbers = range(2, n_max + 1)
-        resonance_data = {
-            'numbers': [],
-            'birth_times': [],
-            'frequencies': [],
-            'resistances': [],
-            'quality_factors': [],
-            'is_prime': []
-        }
+    def analyze_number_resonance(self, n_max: int = 100) -> Dict[str, np.ndarray]:
+        """تحليل رنين الأعداد 2..n_max كأعمدة ndarray
         
-        for n in numbers:
-            tau_n = self.ns.birth_time(n)
-            freq_n = self.ns.natural_frequency(n)
-            res_n = self.ns.resistance(n)
-            Q_n = freq_n / res_n if res_n > 0 else 0  # معامل الجودة
-            
-            resonance_data['numbers'].append(n)
-            resonance_data['birth_times'].append(tau_n)
-            resonance_data['frequencies'].append(freq_n)
-            resonance_data['resistances'].append(res_n)
-            resonance_data['quality_factors'].append(Q_n)
-            resonance_data['is_prime'].append(n in self.ns.primes)
-        
-        return resonance_data
+        الأعمدة مناظير على جدول TemporalNumberSystem.properties واحد (يحسبه
+        على كتل صفوف، فلا تتجاوز الذاكرة المؤقتة كتلة). لمديات لا تسع
+        أعمدتها الذاكرة (~41 بايت لكل عدد) استخدم resonance_summary.
+        """
+        table = self.ns.properties(np.arange(2, max(n_max, 1) + 1, dtype=np.int64),
+                                   fields=RESONANCE_COLUMNS.values())
+        return {key: table[field] for key, field in RESONANCE_COLUMNS.items()}
+    
+    def iter_number_resonance(self, n_max: int,
+                              chunk_size: int = RESONANCE_CHUNK,
+                              columns: Sequence[str] = tuple(RESONANCE_COLUMNS)
+                              ) -> Iterator[Dict[str, np.ndarray]]:
+        """أعمدة الرنين (columns منها فقط) لكتل متتالية من [2, n_max]
+        
+        كل كتلة جدول TemporalNumberSystem.properties لمداها (الأولية من قناع
+        غربال للنافذة نفسها)، فالذاكرة O(chunk_size) مهما كبر n_max.
+        """
+        for lo in range(2, n_max + 1, chunk_size):
+            hi = min(lo + chunk_size, n_max + 1)
+            table = self.ns.properties(np.arange(lo, hi, dtype=np.int64),
+                                       fields=[RESONANCE_COLUMNS[c] for c in columns])
+            yield {c: table[RESONANCE_COLUMNS[c]] for c in columns}
+    
+    def resonance_summary(self, n_max: int, chunk_size: int = RESONANCE_CHUNK) -> Dict:
+        """إحصاءات الرنين للأعداد الأولية والمركبة حتى n_max بذاكرة ثابتة
+        
+        يمر على الكتل مرة واحدة ويجمع لكل فئة العدد والمجموع ومجموع المربعات
+        والقيم الصغرى والعظمى لمعامل الجودة والتردد.
+        """
+        columns = ('quality_factors', 'frequencies')
+        stats = {group: {'count': 0, **{c: {'sum': 0.0, 'sum_sq': 0.0,
+                                            'min': np.inf, 'max': -np.inf}
+                                        for c in columns}}
+                 for group in ('primes', 'composites')}
+        for chunk in self.iter_number_resonance(n_max, chunk_size,
+                                                columns + ('is_prime',)):
+            # الأعمدة مناظير متباعدة على جدول الخصائص: نسخة متصلة قبل الانتقاء
+            chunk = {c: np.ascontiguousarray(column) for c, column in chunk.items()}
+            for group, mask in (('primes', chunk['is_prime']),
+                                ('composites', ~chunk['is_prime'])):
+                if not mask.any():
+                    continue
+                stats[group]['count'] += int(mask.sum())
+                for c in columns:
+                    values = chunk[c][mask]
+                    acc = stats[group][c]
+                    acc['sum'] += float(values.sum())
+                    acc['sum_sq'] += float(np.dot(values, values))
+                    acc['min'] = min(acc['min'], float(values.min()))
+                    acc['max'] = max(acc['max'], float(values.max()))
+        
+        summary = {'n_max': n_max}
+        for group, group_stats in stats.items():
+            count = group_stats['count']
+            summary[group] = {'count': count}
+            for c in columns:
+                acc = group_stats[c]
+                mean = acc['sum'] / count if count else float('nan')
+                variance = acc['sum_sq'] / count - mean**2 if count else float('nan')
+                summary[group][c] = {'mean': mean, 'std': float(np.sqrt(max(variance, 0.0))),
+                                     'min': acc['min'], 'max': acc['max']}
+        return summary
     
     def fourier_analysis_of_primes(self) -> Dict:
         """التحليل الطيفي للأعداد الأولية"""
         # أزمنة ولادة الأعداد الأولية
-        prime_times = [self.ns.birth_time(p) for p in self.ns.primes[:100]]
+        prime_times = self.ns.birth_time(self.ns.primes[:100])
         
         # إنشاء إشارة زمنية
         t_max = max(prime_times)
         t = np.linspace(0, t_max, 1000)
         signal_primes = np.zeros_like(t)
         
-        # إضافة نبضات عند أزمنة الأعداد الأولية
-        for tau_p in prime_times:
-            idx = np.argmin(np.abs(t - tau_p))
-            signal_primes[idx] = 1.0
+        # إضافة نبضات عند أزمنة الأعداد الأولية (أقرب نقطة شبكة لكل زمن)
+        idx = np.clip(np.searchsorted(t, prime_times), 1, len(t) - 1)
+        idx -= prime_times - t[idx - 1] <= t[idx] - prime_times
+        signal_primes[idx] = 1.0
         
         # التحليل الطيفي
+        from scipy import signal
         frequencies, power_spectrum = signal.periodogram(signal_primes, fs=1000/t_max)
         
         return {
@@ -81,7 +131,7 @@ class AdvancedTemporalAnalysis:
     def energy_landscape_analysis(self) -> Dict:
         """تحليل المشهد الطاقي"""
         sigma_range = np.linspace(0.1, 1.0, 50)
-        T_test = 14.134725142  # أول صفر معروف
+        T_test = FIRST_KNOWN_ZEROS[0]  # أول صفر معروف
         
         energies = []
         for sigma in sigma_range:
@@ -104,7 +154,7 @@ class AdvancedTemporalAnalysis:
     def temporal_correlation_analysis(self) -> Dict:
         """تحليل الارتباط الزمني"""
         primes = self.ns.primes[:50]
-        birth_times = [self.ns.birth_time(p) for p in primes]
+        birth_times = self.ns.birth_time(primes)
         
         # حساب الارتباطات
         correlations = []
@@ -154,17 +204,16 @@ class AdvancedTemporalAnalysis:
         correlation = self.temporal_correlation_analysis()
         quantum = self.quantum_coherence_analysis()
         
-        # إنشاء الرسوم البيانية
+        # إنشاء الرسوم البيانية (matplotlib يُحمّل هنا فقط، لا عند الاستيراد)
+        import matplotlib.pyplot as plt
         fig = plt.figure(figsize=(20, 15))
         
         # 1. تحليل الرنين
         ax1 = plt.subplot(3, 3, 1)
         primes_mask = resonance['is_prime']
-        plt.scatter([resonance['birth_times'][i] for i in range(len(primes_mask)) if primes_mask[i]], 
-                   [resonance['frequencies'][i] for i in range(len(primes_mask)) if primes_mask[i]], 
+        plt.scatter(resonance['birth_times'][primes_mask], resonance['frequencies'][primes_mask],
                    c='red', label='أعداد أولية', s=50, alpha=0.7)
-        plt.scatter([resonance['birth_times'][i] for i in range(len(primes_mask)) if not primes_mask[i]], 
-                   [resonance['frequencies'][i] for i in range(len(primes_mask)) if not primes_mask[i]], 
+        plt.scatter(resonance['birth_times'][~primes_mask], resonance['frequencies'][~primes_mask],
                    c='blue', label='أعداد مركبة', s=30, alpha=0.5)
         plt.xlabel('زمن الولادة τ')
         plt.ylabel('التردد الطبيعي ω')
@@ -208,8 +257,8 @@ class AdvancedTemporalAnalysis:
         
         # 6. توزيع معاملات الجودة
         ax6 = plt.subplot(3, 3, 6)
-        Q_primes = [resonance['quality_factors'][i] for i in range(len(primes_mask)) if primes_mask[i]]
-        Q_composites = [resonance['quality_factors'][i] for i in range(len(primes_mask)) if not primes_mask[i]]
+        Q_primes = resonance['quality_factors'][primes_mask]
+        Q_composites = resonance['quality_factors'][~primes_mask]
         plt.hist(Q_primes, bins=20, alpha=0.7, label='أعداد أولية', color='red')
         plt.hist(Q_composites, bins=20, alpha=0.7, label='أعداد مركبة', color='blue')
         plt.xlabel('معامل الجودة Q')
@@ -319,7 +368,7 @@ def main():
     
     # محرك التنبؤ
     predictor = TemporalPredictionEngine(advanced_analysis)
-    known_zeros = [14.134725142, 21.022039639, 25.010857580, 30.424876126, 32.935061588]
+    known_zeros = list(FIRST_KNOWN_ZEROS)
     predictions = predictor.predict_next_zeros(known_zeros, 5)
     confidence_intervals = predictor.calculate_confidence_intervals(predictions)
     
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+قياس نقطة التقاطع: التقييم المتعدد مقابل التقييم نقطة بنقطة
+Crossover benchmark: Odlyzko–Schönhage multi-evaluation vs per-point Z(t)
+
+لكل ارتفاع T يقيس زمن حساب Z(t) على M نقطة متقاربة (ربع متوسط المسافة
+بين الأصفار) بالطريقتين، ويطبع أصغر M يصبح عنده التقييم المتعدد أسرع.
+
+الاستخدام / Usage:
+    python benchmarks/bench_odlyzko_schonhage.py
+    python benchmarks/bench_odlyzko_schonhage.py --heights 1e6 1e8 --max-points 65536
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from riemann_siegel import hardy_z
+from odlyzko_schonhage import OdlyzkoSchonhage
+
+
+def _best_time(func, repeats: int) -> float:
+    """أفضل زمن من عدة تكرارات"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def crossover(height: float, max_points: int, repeats: int = 3) -> dict:
+    """قياس الزمنين لأعداد نقاط متزايدة عند ارتفاع واحد"""
+    engine = OdlyzkoSchonhage()
+    step = 2 * np.pi / np.log(height / (2 * np.pi)) / 4
+    rows = []
+    crossover_points = None
+
+    M = 16
+    while M <= max_points:
+        t = height + step * np.arange(M)
+        direct = _best_time(lambda: hardy_z(t), repeats)
+        multi = _best_time(lambda: engine.hardy_z_grid(height, step, M), repeats)
+        rows.append({'points': M, 'direct_s': direct, 'multi_s': multi,
+                     'direct_us_per_point': 1e6 * direct / M,
+                     'multi_us_per_point': 1e6 * multi / M})
+        # نقطة التقاطع: أصغر M يبقى بعدها التقييم المتعدد أسرع دائماً
+        if multi >= direct:
+            crossover_points = None
+        elif crossover_points is None:
+            crossover_points = M
+        M *= 4
+
+    return {'height': height,
+            'terms': int(np.sqrt(height / (2 * np.pi))),
+            'crossover_points': crossover_points,
+            'rows': rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--heights', type=float, nargs='+', default=[1e4, 1e6, 1e8])
+    parser.add_argument('--max-points', type=int, default=2**18)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='إخراج JSON فقط')
+    args = parser.parse_args()
+
+    results = [crossover(h, args.max_points, args.repeats) for h in args.heights]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for res in results:
+        print(f"\nT = {res['height']:.0e}  (N = {res['terms']} حداً)")
+        print(f"{'M':>8} | {'مباشر µs/نقطة':>14} | {'متعدد µs/نقطة':>14}")
+        for row in res['rows']:
+            print(f"{row['points']:>8} | {row['direct_us_per_point']:>14.2f} | "
+                  f"{row['multi_us_per_point']:>14.2f}")
+        print(f"نقطة التقاطع: M ≈ {res['crossover_points']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+ميزانية زمن بدء التشغيل لوحدات الحساب
+Startup budget for the compute modules
+
+يقيس زمن `import <module>` في مفسر جديد (أفضل زمن من عدة تكرارات بعد طرح
+زمن المفسر الفارغ)، ويتحقق أن مكتبات الرسم والمكتبات الاختيارية لا تُحمّل
+عند الاستيراد. يخرج برمز 1 إن تجاوزت وحدة الميزانية أو حمّلت مكتبة ممنوعة،
+ويطبع أثقل الاستيرادات (python -X importtime) للتشخيص.
+
+الاستخدام / Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --budget 0.25 --modules riemann_temporal_solver
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ['riemann_temporal_solver', 'advanced_temporal_analysis',
+                   'experimental_verification']
+# ميزانية زمن الاستيراد بالثواني (بعد طرح زمن المفسر الفارغ)
+DEFAULT_BUDGET = 0.35
+# مكتبات يجب ألا تُحمّل إلا عند استدعاء دوال التصور أو الطرق الاختيارية
+LAZY_MODULES = ['matplotlib', 'scipy', 'seaborn', 'pandas', 'mpmath']
+
+
+def _run(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def import_time(module: str, repeats: int) -> float:
+    """أفضل زمن استيراد للوحدة في مفسر جديد، بعد طرح زمن المفسر الفارغ"""
+    baseline = min(_run('pass') for _ in range(repeats))
+    return max(0.0, min(_run(f'import {module}') for _ in range(repeats)) - baseline)
+
+
+def loaded_lazy_modules(module: str):
+    """المكتبات الممنوعة التي حمّلها استيراد الوحدة"""
+    code = (f'import sys, json, {module}; '
+            f'print(json.dumps(sorted(m for m in {LAZY_MODULES!r} if m in sys.modules)))')
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def heaviest_imports(module: str, top: int = 10):
+    """أثقل الاستيرادات التراكمية (µs) حسب python -X importtime"""
+    err = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                         cwd=ROOT, check=True, capture_output=True, text=True).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='إخراج JSON فقط')
+    args = parser.parse_args()
+
+    results = []
+    for module in args.modules:
+        seconds = import_time(module, args.repeats)
+        lazy = loaded_lazy_modules(module)
+        results.append({'module': module, 'import_s': seconds, 'budget_s': args.budget,
+                        'eager_optional_modules': lazy,
+                        'ok': seconds <= args.budget and not lazy})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for res in results:
+            status = '✅' if res['ok'] else '❌'
+            print(f"{status} {res['module']:<28} {1e3 * res['import_s']:7.1f} ms "
+                  f"(الميزانية {1e3 * res['budget_s']:.0f} ms)")
+            if res['eager_optional_modules']:
+                print(f"   مكتبات حُمّلت عند الاستيراد: {', '.join(res['eager_optional_modules'])}")
+            if not res['ok']:
+                for cumulative, name in heaviest_imports(res['module']):
+                    print(f"   {cumulative / 1e3:8.1f} ms  {name}")
+
+    sys.exit(0 if all(res['ok'] for res in results) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+مجموعة قياس أداء النواة العددية مع مقارنة بخط أساس
+Benchmark suite for the numerical core with baseline comparison
+
+يقيس نقاط الدخول الرئيسية بعدة أحجام: _generate_primes (حدود الأعداد
+الأولية)، temporal_zeta و evaluate_grid (أحجام الشبكة)، find_critical_zeros
+(مديات T والمعايير)، ودوال التحليل المتقدم والتحقق التجريبي. لكل حالة
+يُسجل أفضل زمن والوسيط من عدة تكرارات، ويُكتب الناتج JSON. مع --baseline
+تُقارن الأزمنة بملف سابق، وأي حالة أبطأ بأكثر من --threshold تُعد تراجعاً
+(رمز خروج 1).
+
+الاستخدام / Usage:
+    python benchmarks/run_benchmarks.py --quick
+    python benchmarks/run_benchmarks.py --output current.json --baseline baseline.json
+    python benchmarks/run_benchmarks.py --update-baseline baseline.json
+    python benchmarks/run_benchmarks.py --filter zeros --threshold 0.1
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from riemann_temporal_solver import TemporalNumberSystem, TemporalRiemannSolver
+
+# أقل زمن لكل عينة قياس: الحالات الأسرع تُكرر داخل العينة
+MIN_SAMPLE_S = 0.05
+
+# حالة قياس: (المعرف، المعاملات، دالة تحضير تعيد الدالة المقاسة)
+Case = Tuple[str, Dict, Callable[[], Callable[[], object]]]
+
+
+def _solver(prime_limit: int = 10000) -> TemporalRiemannSolver:
+    return TemporalRiemannSolver(prime_limit=prime_limit)
+
+
+def prime_cases(quick: bool) -> List[Case]:
+    limits = [10**5, 10**6] if quick else [10**5, 10**6, 10**7, 10**8]
+    ns = TemporalNumberSystem(prime_limit=10)
+    return [('primes/generate', {'limit': limit},
+             lambda limit=limit: lambda: ns._generate_primes(limit))
+            for limit in limits]
+
+
+def zeta_cases(quick: bool) -> List[Case]:
+    cases: List[Case] = []
+    for prime_limit in ([10**4] if quick else [10**4, 10**6]):
+        def single(prime_limit=prime_limit):
+            zeta = _solver(prime_limit).zeta_function
+            return lambda: zeta.temporal_zeta(0.5, 14.134725)
+        cases.append(('zeta/temporal_zeta', {'prime_limit': prime_limit}, single))
+
+    for points in ([10**3, 10**4] if quick else [10**3, 10**4, 10**5]):
+        def grid(points=points):
+            zeta = _solver().zeta_function
+            Ts = np.linspace(10.0, 1000.0, points)
+            return lambda: zeta.evaluate_grid(0.5, Ts)
+        cases.append(('zeta/evaluate_grid', {'points': points}, grid))
+    return cases
+
+
+def zero_cases(quick: bool) -> List[Case]:
+    configs = [
+        ('hardy', (100.0, 1000.0), 10**4, 'uniform'),
+        ('hardy', (100.0, 1000.0), 10**4, 'adaptive'),
+        ('energy', (10.0, 50.0), 2000, 'uniform'),
+    ]
+    if not quick:
+        configs += [
+            ('hardy', (1e4, 2e4), 10**5, 'uniform'),
+            ('hardy', (1e4, 2e4), 10**5, 'adaptive'),
+            ('hardy', (1e6, 1e6 + 1e3), 10**4, 'uniform'),
+        ]
+    cases: List[Case] = []
+    for criterion, T_range, num_points, scan in configs:
+        def search(criterion=criterion, T_range=T_range, num_points=num_points, scan=scan):
+            finder = _solver().zero_finder
+            return lambda: finder.find_critical_zeros(T_range, num_points,
+                                                      criterion=criterion, scan=scan)
+        params = {'criterion': criterion, 'T_range': list(T_range),
+                  'num_points': num_points, 'scan': scan}
+        cases.append(('zeros/find_critical_zeros', params, search))
+    return cases
+
+
+def multi_evaluation_cases(quick: bool) -> List[Case]:
+    """شبكة Z(t) عبر أودليزكو-شونهاجه (تفاصيل التقاطع في bench_odlyzko_schonhage.py)"""
+    from odlyzko_schonhage import OdlyzkoSchonhage
+    cases: List[Case] = []
+    for height in ([1e6] if quick else [1e4, 1e6, 1e8]):
+        for points in ([2**12] if quick else [2**12, 2**16]):
+            def grid(height=height, points=points):
+                engine = OdlyzkoSchonhage()
+                step = 2 * np.pi / np.log(height / (2 * np.pi)) / 4
+                return lambda: engine.hardy_z_grid(height, step, points)
+            cases.append(('zeta/odlyzko_schonhage_grid',
+                          {'height': height, 'points': points}, grid))
+    return cases
+
+
+def analysis_cases(quick: bool) -> List[Case]:
+    from advanced_temporal_analysis import AdvancedTemporalAnalysis
+    from experimental_verification import ExperimentalVerification
+
+    cases: List[Case] = []
+    for n_max in ([100, 10**4] if quick else [100, 10**4, 10**6]):
+        def resonance(n_max=n_max):
+            analysis = AdvancedTemporalAnalysis(_solver())
+            return lambda: analysis.analyze_number_resonance(n_max)
+        cases.append(('analysis/number_resonance', {'n_max': n_max}, resonance))
+
+    for method in ('fourier_analysis_of_primes', 'energy_landscape_analysis',
+                   'temporal_correlation_analysis', 'quantum_coherence_analysis'):
+        def advanced(method=method):
+            return getattr(AdvancedTemporalAnalysis(_solver()), method)
+        cases.append((f'analysis/{method}', {}, advanced))
+
+    for method in ('test_energy_balance_theorem', 'test_logarithmic_time_hypothesis',
+                   'test_frequency_resistance_relationship', 'test_prime_resonance_theory'):
+        def verification(method=method):
+            return getattr(ExperimentalVerification(_solver()), method)
+        cases.append((f'verification/{method}', {}, verification))
+    return cases
+
+
+SUITES = {
+    'primes': prime_cases,
+    'zeta': zeta_cases,
+    'zeros': zero_cases,
+    'multi_evaluation': multi_evaluation_cases,
+    'analysis': analysis_cases,
+}
+
+
+def case_id(name: str, params: Dict) -> str:
+    """معرف ثابت للحالة يُطابق به خط الأساس"""
+    if not params:
+        return name
+    return f"{name}[{','.join(f'{k}={v}' for k, v in sorted(params.items()))}]"
+
+
+def measure(func: Callable[[], object], repeats: int) -> List[float]:
+    """زمن الاستدعاء الواحد في كل تكرار (مع إسكات مخرجات الدوال التي تطبع تقدمها)
+
+    الحالات الأسرع من MIN_SAMPLE_S تُستدعى عدة مرات في كل تكرار كما في timeit،
+    حتى لا تطغى دقة المؤقت وضجيجه على النتيجة.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func()  # تسخين (ذاكرات مؤقتة، تحميل كسول) ومعايرة
+        first = time.perf_counter() - start
+        number = max(1, int(np.ceil(MIN_SAMPLE_S / max(first, 1e-9))))
+
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            times.append((time.perf_counter() - start) / number)
+    return times
+
+
+def run(suites: List[str], quick: bool, repeats: int, name_filter: str = '') -> Dict:
+    results = []
+    for suite in suites:
+        for name, params, setup in SUITES[suite](quick):
+            cid = case_id(name, params)
+            if name_filter and name_filter not in cid:
+                continue
+            with contextlib.redirect_stdout(io.StringIO()):
+                func = setup()
+            times = measure(func, repeats)
+            results.append({'id': cid, 'suite': suite, 'name': name, 'params': params,
+                            'best_s': min(times), 'median_s': statistics.median(times),
+                            'repeats': repeats})
+            print(f"  {cid:<72} {1e3 * min(times):10.2f} ms", file=sys.stderr)
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """مقارنة أفضل الأزمنة بخط الأساس؛ ratio > 1 + threshold تراجع"""
+    base = {r['id']: r for r in baseline['results']}
+    rows = []
+    for res in current['results']:
+        if res['id'] not in base:
+            continue
+        ratio = res['best_s'] / base[res['id']]['best_s']
+        rows.append({'id': res['id'], 'baseline_s': base[res['id']]['best_s'],
+                     'current_s': res['best_s'], 'ratio': ratio,
+                     'regression': ratio > 1 + threshold,
+                     'improvement': ratio < 1 / (1 + threshold)})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--suites', nargs='+', choices=sorted(SUITES), default=list(SUITES))
+    parser.add_argument('--quick', action='store_true', help='الأحجام الصغيرة فقط')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--filter', default='', help='تشغيل الحالات التي يحوي معرفها النص فقط')
+    parser.add_argument('--output', help='كتابة الأزمنة JSON في هذا الملف')
+    parser.add_argument('--baseline', help='ملف JSON سابق للمقارنة')
+    parser.add_argument('--update-baseline', metavar='PATH',
+                        help='حفظ التشغيل الحالي كخط أساس')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='نسبة التباطؤ المسموحة قبل عد الحالة تراجعاً (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    current = run(args.suites, args.quick, args.repeats, args.filter)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+    if args.update_baseline:
+        with open(args.update_baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(current, baseline, args.threshold)
+        current['comparison'] = {'baseline': args.baseline, 'threshold': args.threshold,
+                                 'rows': rows}
+        print(f"\n{'الحالة':<72} {'الأساس ms':>10} {'الحالي ms':>10} {'النسبة':>7}",
+              file=sys.stderr)
+        for row in rows:
+            flag = '❌' if row['regression'] else ('✅' if row['improvement'] else '  ')
+            print(f"{row['id']:<72} {1e3 * row['baseline_s']:10.2f} "
+                  f"{1e3 * row['current_s']:10.2f} {row['ratio']:6.2f}x {flag}",
+                  file=sys.stderr)
+        regressions = [row['id'] for row in rows if row['regression']]
+        if regressions:
+            print(f"\nتراجع في {len(regressions)} حالة (أبطأ بأكثر من "
+                  f"{args.threshold:.0%})", file=sys.stderr)
+
+    print(json.dumps(current, indent=2))
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+التحقق المُثبت من الأصفار بحساب الفترات
+Certified zero verification with interval arithmetic
+
+لكل صفر مُقدَّر z نختار فترة ضيقة [a, b] حوله ونحسب حصراً مُثبتاً لـ Z(a)
+و Z(b) بحساب الفترات (mpmath.iv): المجموع الرئيسي لريمان-سيغل وحد C0
+بالفترات، مع حد غابكه (1979) لما بعد C0: |R - C0·(t/2π)^(-1/4)| ≤ 0.127·t^(-3/4)
+لـ t ≥ 200، وحد محافظ t^(-5) لذيل متسلسلة ستيرلنغ في θ(t). إن اختلفت
+إشارتا الحصرين يقيناً فهناك صفر على الخط الحرج داخل [a, b].
+For each zero an interval [a, b] is certified when rigorous enclosures of
+Z(a) and Z(b) (interval Riemann–Siegel main sum + C0 term + Gabcke's
+0.127·t^(-3/4) bound, valid for t ≥ 200) have strictly opposite signs.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+import riemann_siegel
+
+# أدنى ارتفاع يصح عنده حد غابكه للباقي
+CERTIFIED_MIN_HEIGHT = 200.0
+
+
+def gabcke_bound(t: float) -> float:
+    """حد غابكه لخطأ صيغة ريمان-سيغل بعد حد C0 (t ≥ 200)"""
+    return 0.127 * t ** -0.75
+
+
+@lru_cache(maxsize=8)
+def _log_and_weight(N: int, prec: int):
+    """ln(n) و n^(-1/2) بالفترات لـ n ≤ N (تُحسب مرة لكل N ودقة)"""
+    from mpmath import iv
+    saved_prec = iv.prec
+    iv.prec = prec
+    try:
+        return [(iv.log(n), 1 / iv.sqrt(n)) for n in range(1, N + 1)]
+    finally:
+        iv.prec = saved_prec
+
+
+def z_enclosure(t: float, dps: int = 20):
+    """حصر مُثبت لـ Z(t) عند نقطة float64 t ≥ 200 - Rigorous enclosure of Z(t)"""
+    from mpmath import iv
+    if t < CERTIFIED_MIN_HEIGHT:
+        raise ValueError(f"الحصر المُثبت يتطلب t ≥ {CERTIFIED_MIN_HEIGHT}")
+    # خانات إضافية بقدر حجم الطور t·ln(n) (iv بلا workdps: نعيد الدقة يدوياً)
+    saved_prec = iv.prec
+    iv.dps = dps + int(np.log10(t)) + 1
+    try:
+        T = iv.mpf(t)
+        two_pi = 2 * iv.pi
+        tail = iv.mpf(1) / T ** 5
+        theta = (T / 2 * iv.log(T / two_pi) - T / 2 - iv.pi / 8
+                 + 1 / (48 * T) + 7 / (5760 * T ** 3) + iv.mpf([-1, 1]) * tail)
+
+        N = int(np.floor(np.sqrt(t / (2 * np.pi))))
+        a = iv.sqrt(T / two_pi)
+        # N من float64 قد يخطئ عند حد مربع كامل: نتأكد أن N ≤ a < N + 1
+        if not (a.a >= N and a.b < N + 1):
+            return None
+
+        main = iv.mpf(0)
+        for log_n, weight in _log_and_weight(N, iv.prec):
+            main += iv.cos(theta - T * log_n) * weight
+
+        # حد C0 = cos(2π(p² - p - 1/16)) / cos(2πp)
+        p = a - N
+        denominator = iv.cos(two_pi * p)
+        if denominator.a <= 0 <= denominator.b:
+            return None  # p قريبة جداً من 1/4 أو 3/4: تُجرب نقطة أخرى
+        c0 = iv.cos(two_pi * (p * p - p - iv.mpf(1) / 16)) / denominator
+        sign = 1 if N % 2 == 1 else -1  # (-1)^(N-1)
+        bound = iv.mpf('0.127') / T ** iv.mpf(0.75)
+        return 2 * main + sign * c0 / iv.sqrt(a) + iv.mpf([-1, 1]) * bound
+    finally:
+        iv.prec = saved_prec
+
+
+def certify_zero(zero: float, dps: int = 20, max_doublings: int = 12,
+                 max_width: Optional[float] = None) -> Dict:
+    """إثبات وجود صفر في فترة ضيقة حول zero
+
+    نصف العرض الأولي ضعف (خطأ الحصر + خطأ float64) مقسوماً على |Z'(zero)|
+    التقريبي، ويُضاعف حتى يثبت تغير الإشارة أو يتجاوز max_width.
+    """
+    record = {'zero': float(zero), 'certified': False, 'enclosure': None}
+    if zero < CERTIFIED_MIN_HEIGHT:
+        record['reason'] = f'below certified height {CERTIFIED_MIN_HEIGHT}'
+        return record
+
+    # ربع متوسط المسافة بين الأصفار حتى لا تحوي الفترة صفرين
+    spacing = 2 * np.pi / np.log(zero / (2 * np.pi))
+    if max_width is None:
+        max_width = spacing / 4
+    delta = 1e-3 * spacing
+    slope = abs(riemann_siegel.hardy_z(zero + delta)
+                - riemann_siegel.hardy_z(zero - delta)) / (2 * delta)
+    noise = gabcke_bound(zero) + riemann_siegel.hardy_z_error(zero)
+    half_width = max(2 * noise / max(slope, 1e-300), 4 * np.finfo(float).eps * zero)
+
+    for _ in range(max_doublings + 1):
+        if 2 * half_width > max_width:
+            break
+        low, high = zero - half_width, zero + half_width
+        z_low, z_high = z_enclosure(low, dps), z_enclosure(high, dps)
+        if z_low is not None and z_high is not None and \
+                (z_low.b < 0 < z_high.a or z_high.b < 0 < z_low.a):
+            record.update(certified=True, enclosure=[float(low), float(high)],
+                          Z_low=[float(z_low.a), float(z_low.b)],
+                          Z_high=[float(z_high.a), float(z_high.b)])
+            return record
+        half_width *= 2
+
+    record['reason'] = 'sign change not certified'
+    return record
+
+
+def _certify_chunk(args) -> List[Dict]:
+    zeros, dps = args
+    return [certify_zero(z, dps) for z in zeros]
+
+
+def _record_batches(zeros: np.ndarray, workers: Optional[int], dps: int,
+                    chunk_size: int) -> Iterator[List[Dict]]:
+    """سجلات الكتل بالترتيب؛ العمليات الفرعية تستلم نافذة محدودة من الكتل"""
+    chunks = ((zeros[i:i + chunk_size].tolist(), dps)
+              for i in range(0, len(zeros), chunk_size))
+    if workers is None or workers <= 1:
+        yield from map(_certify_chunk, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            window = list(islice(chunks, 4 * workers))
+            if not window:
+                return
+            yield from executor.map(_certify_chunk, window)
+
+
+def certify_zeros(zeros: Sequence[float], workers: Optional[int] = None,
+                  dps: int = 20, chunk_size: int = 64,
+                  records_file: Optional[str] = None) -> Dict:
+    """إثبات مجموعة أصفار (بالتوازي عبر ProcessPoolExecutor إن workers > 1)
+
+    records_file: كتابة سجل لكل صفر (JSON Lines) في الملف بدلاً من قائمة،
+    فيُعاد في records مرجع {'file', 'count'} ولا تكبر الذاكرة مع عدد الأصفار.
+    """
+    zeros = np.asarray(zeros, dtype=np.float64)
+    if np.any(zeros[1:] < zeros[:-1]):
+        zeros = np.sort(zeros)
+
+    records: List[Dict] = []
+    out = open(records_file, 'w', encoding='utf-8') if records_file else None
+    counts = {'total': 0, 'certified': 0}
+
+    def emit(batch: List[Dict]):
+        counts['total'] += len(batch)
+        counts['certified'] += sum(r['certified'] for r in batch)
+        if out is None:
+            records.extend(batch)
+        else:
+            out.write(''.join(json.dumps(r) + '\n' for r in batch))
+
+    # فترتان متداخلتان قد تشهدان لنفس تغير الإشارة: لا تُحسب أي منهما. آخر
+    # سجل مُثبت وما بعده يبقيان معلّقين حتى يُقارن بالمُثبت التالي
+    previous = None
+    pending: List[Dict] = []
+    try:
+        for batch in _record_batches(zeros, workers, dps, chunk_size):
+            for record in batch:
+                if not record['certified']:
+                    pending.append(record)
+                    continue
+                if previous is not None and previous['enclosure'][1] >= record['enclosure'][0]:
+                    for r in (previous, record):
+                        r.update(certified=False, reason='overlapping enclosure')
+                emit(pending)
+                previous, pending = record, [record]
+            if previous is None:
+                emit(pending)
+                pending = []
+        emit(pending)
+    finally:
+        if out is not None:
+            out.close()
+
+    return {
+        'total': counts['total'],
+        'certified': counts['certified'],
+        'records': records if out is None else {'file': records_file,
+                                                'count': counts['total']},
+    }
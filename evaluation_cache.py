@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+ذاكرة تخزين مؤقت لقيم دالة زيتا
+Memoizing cache for zeta evaluations
+
+طبقتان: ذاكرة LRU محدودة الحجم داخل العملية، وطبقة دائمة اختيارية في
+قاعدة SQLite تبقى بين التشغيلات ويتشاركها أكثر من عملية. المفتاح هو
+(backend, precision, σ, T) والقيمة عدد مركب.
+Two tiers: a bounded in-process LRU and an optional persistent SQLite
+tier shared across runs and processes, keyed by (backend, precision, σ, T).
+"""
+
+import sqlite3
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class EvaluationCache:
+    """ذاكرة مؤقتة لقيم زيتا - LRU + optional on-disk zeta value cache"""
+
+    def __init__(self, maxsize: int = 2**16, path: Optional[str] = None):
+        # أقصى عدد من القيم في ذاكرة العملية (0 يعطل طبقة الذاكرة)
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._memory: 'OrderedDict[Tuple, complex]' = OrderedDict()
+        self._db = None
+        if path is not None:
+            self._connect()
+
+    def _connect(self):
+        # timeout يسمح لعمليات المجمع بالكتابة في نفس الملف بالتناوب
+        self._db = sqlite3.connect(self.path, timeout=30.0)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS zeta_values ('
+            'backend TEXT, precision TEXT, sigma REAL, t REAL, re REAL, im REAL, '
+            'PRIMARY KEY (backend, precision, sigma, t))')
+        self._db.commit()
+
+    def __getstate__(self):
+        # اتصال SQLite لا يُنقل بين العمليات: العملية الفرعية تعيد فتح الملف
+        return {'maxsize': self.maxsize, 'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['maxsize'], state['path'])
+
+    def lookup(self, backend: str, precision: str, sigmas: np.ndarray,
+               Ts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """القيم المخزنة لنقاط (σ, T)؛ يعيد (values, missing) حيث missing قناع"""
+        values = np.empty(len(Ts), dtype=np.complex128)
+        missing = np.ones(len(Ts), dtype=bool)
+        for i, (sigma, T) in enumerate(zip(sigmas.tolist(), Ts.tolist())):
+            key = (backend, precision, sigma, T)
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    'SELECT re, im FROM zeta_values WHERE backend=? AND precision=? '
+                    'AND sigma=? AND t=?', key).fetchone()
+                if row is not None:
+                    value = complex(*row)
+                    self._remember(key, value)
+            if value is not None:
+                values[i] = value
+                missing[i] = False
+
+        found = int(len(Ts) - missing.sum())
+        self.hits += found
+        self.misses += len(Ts) - found
+        return values, missing
+
+    def store(self, backend: str, precision: str, sigmas: np.ndarray,
+              Ts: np.ndarray, values: np.ndarray):
+        """تخزين قيم محسوبة في الطبقتين"""
+        rows = [(backend, precision, sigma, T, v.real, v.imag)
+                for sigma, T, v in zip(sigmas.tolist(), Ts.tolist(),
+                                       np.asarray(values, dtype=np.complex128).tolist())]
+        for row in rows:
+            self._remember(row[:4], complex(row[4], row[5]))
+        if self._db is not None and rows:
+            self._db.executemany('INSERT OR REPLACE INTO zeta_values VALUES (?, ?, ?, ?, ?, ?)',
+                                 rows)
+            self._db.commit()
+
+    def _remember(self, key: Tuple, value: complex):
+        if self.maxsize <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def info(self) -> Dict:
+        """عدادات الإصابة والإخفاق - hit/miss counters"""
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'memory_entries': len(self._memory),
+                'maxsize': self.maxsize, 'path': self.path}
+
+    def clear(self):
+        """تفريغ طبقة الذاكرة وتصفير العدادات (الطبقة الدائمة تبقى)"""
+        self._memory.clear()
+        self.hits = self.misses = 0
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
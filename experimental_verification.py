@@ -11,8 +11,6 @@ Date: 2025-07-25
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import stats
 import time
 from typing import Dict, List, Tuple
 import json
@@ -20,7 +18,9 @@ import json
 class ExperimentalVerification:
     """التحقق التجريبي الشامل"""
     
-    def __init__(self):
+    def __init__(self, solver=None):
+        # حلال مشترك (مع ذاكرته المؤقتة) بدلاً من بناء حلال جديد في كل اختبار
+        self.solver = solver
         self.test_results = {}
         self.accuracy_threshold = 0.85  # حد الدقة المقبول
         
@@ -72,6 +72,7 @@ class ExperimentalVerification:
             measured_times.append(measured_time)
         
         # حساب معامل الارتباط
+        from scipy import stats
         correlation, p_value = stats.pearsonr(theoretical_times, measured_times)
         
         # حساب متوسط الخطأ النسبي
@@ -153,6 +154,7 @@ class ExperimentalVerification:
         composite_resonances = [calculate_resonance_strength(c) for c in composites]
         
         # اختبار إحصائي للفرق بين المجموعتين
+        from scipy import stats
         t_stat, p_value = stats.ttest_ind(prime_resonances, composite_resonances)
         
         results = {
@@ -173,14 +175,17 @@ class ExperimentalVerification:
         print("🧪 اختبار تقارب دالة زيتا الزمنية...")
         
         from riemann_temporal_solver import TemporalRiemannSolver
+        from known_zeros import FIRST_KNOWN_ZEROS
         
-        solver = TemporalRiemannSolver()
+        if self.solver is None:
+            self.solver = TemporalRiemannSolver(cache_size=2**16)
+        solver = self.solver
         
         # اختبار التقارب عند نقاط مختلفة
         test_points = [
             (2.0, 0.0),    # نقطة بسيطة
             (1.5, 0.0),    # نقطة متوسطة
-            (0.5, 14.134725142)  # صفر معروف
+            (0.5, FIRST_KNOWN_ZEROS[0])  # صفر معروف
         ]
         
         results = {
@@ -191,10 +196,13 @@ class ExperimentalVerification:
             'convergence_achieved': []
         }
         
-        for sigma, T in test_points:
+        # حساب القيم الزمنية لجميع النقاط دفعة واحدة
+        sigmas, Ts = np.array(test_points).T
+        temporal_vals = solver.zeta_function.evaluate_grid(sigmas, Ts)
+        
+        for (sigma, T), temporal_val in zip(test_points, temporal_vals):
             try:
-                # حساب القيمة الزمنية
-                temporal_val = solver.zeta_function.temporal_zeta(sigma, T)
+                temporal_val = complex(temporal_val)
                 
                 # حساب القيمة الكلاسيكية (للمقارنة)
                 if T == 0:  # للقيم الحقيقية فقط
@@ -292,6 +300,7 @@ class ExperimentalVerification:
     
     def visualize_verification_results(self, results: Dict):
         """تصور نتائج التحقق"""
+        import matplotlib.pyplot as plt
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
         
         # 1. معدلات النجاح للاختبارات
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+قياس مراحل التحليل
+Stage-level instrumentation
+
+لكل مرحلة (أو فترة بحث فرعية) يُسجل: زمن الساعة، زمن المعالج، ذروة
+الذاكرة المقيمة (RSS) خلال المرحلة نفسها، وعدد تقييمات الدالة. السجلات
+تُضاف إلى النتائج، ويمكن اختيارياً كتابة ملف cProfile (pstats) للعملية
+الرئيسية، وملف Chrome trace (chrome://tracing أو Perfetto) يضم المراحل
+والفترات الفرعية من كل العمليات على خط زمني واحد.
+Records wall time, CPU time, peak RSS and evaluation counts per stage and
+per search sub-interval, with optional cProfile and Chrome-trace output.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # ويندوز: لا توجد getrusage
+    resource = None
+
+
+def peak_rss_mb(children: bool = False) -> Optional[float]:
+    """ذروة الذاكرة المقيمة طوال عمر العملية (أو لعملياتها الفرعية المنتهية) بالميغابايت"""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # لينكس يعيدها بالكيلوبايت، وماك بالبايت
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def _read_hwm_mb() -> Optional[float]:
+    """VmHWM: ذروة RSS منذ آخر تصفير (لينكس فقط)"""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 2**10
+    except OSError:
+        pass
+    return None
+
+
+def _reset_hwm() -> bool:
+    """تصفير VmHWM إلى RSS الحالية بكتابة 5 في clear_refs؛ False إن لم يتوفر"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+# القياسات المفتوحة في هذه العملية (من الخارج إلى الداخل)؛ تصفير VmHWM عند
+# بدء قياس داخلي يمسح ذروة القياسات الخارجية، فتُحفظ لها قبل التصفير
+_open_measurements: List['Measurement'] = []
+
+
+class Measurement:
+    """قياس مقطع واحد: يبدأ عند الإنشاء ويُغلق بـ finish()
+
+    reset_peak=True: peak_rss_mb ذروة RSS خلال المقطع (تصفير VmHWM عند بدئه)؛
+    وإلا، أو حيث لا يمكن التصفير (غير لينكس)، يُسجل process_peak_rss_mb لعمر
+    العملية.
+    """
+
+    def __init__(self, counter: Optional[Callable[[], int]] = None,
+                 reset_peak: bool = False):
+        self.counter = counter
+        before = _read_hwm_mb() if reset_peak else None
+        for outer in _open_measurements:
+            if outer._resettable and before is not None:
+                outer._peak = max(outer._peak, before)
+        self._resettable = before is not None and _reset_hwm()
+        # بعد التصفير VmHWM تساوي RSS الحالية، وهي بداية ذروة هذا المقطع
+        self._peak = _read_hwm_mb() if self._resettable else None
+        _open_measurements.append(self)
+        self.start = time.time()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._count = counter() if counter else 0
+
+    def finish(self, **fields) -> Dict:
+        record = {
+            'start': self.start,
+            'wall_s': time.perf_counter() - self._wall,
+            'cpu_s': time.process_time() - self._cpu,
+            'pid': os.getpid(),
+        }
+        if self in _open_measurements:
+            _open_measurements.remove(self)
+        if self._resettable:
+            record['peak_rss_mb'] = max(self._peak, _read_hwm_mb())
+        else:
+            record['process_peak_rss_mb'] = peak_rss_mb()
+        if self.counter:
+            record['evaluations'] = self.counter() - self._count
+        record.update(fields)
+        return record
+
+
+class Instrumentation:
+    """سجل مراحل التشغيل - Per-run stage recorder
+
+    profile: مسار ملف pstats (cProfile للعملية الرئيسية فقط)؛
+    trace: مسار ملف Chrome trace JSON؛
+    reset_peak: ذروة RSS لكل مرحلة بتصفير VmHWM عبر /proc/self/clear_refs.
+    التصفير يخص العملية كلها: يمسح أيضاً ذروة ru_maxrss (getrusage) وVmHWM
+    التي يقرؤها أي مستدعٍ آخر، لذا لا يُفعّل إلا بطلب.
+    """
+
+    def __init__(self, profile: Optional[str] = None, trace: Optional[str] = None,
+                 reset_peak: bool = False):
+        self.profile_path = profile
+        self.trace_path = trace
+        self.reset_peak = reset_peak
+        self.stages: List[Dict] = []
+        self._profiler = cProfile.Profile() if profile else None
+
+    def __enter__(self):
+        if self._profiler:
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self._profiler:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.profile_path)
+
+    @contextmanager
+    def stage(self, name: str, counter: Optional[Callable[[], int]] = None):
+        """قياس مرحلة مسماة؛ counter يعيد عداد التقييمات التراكمي"""
+        measurement = Measurement(counter, self.reset_peak)
+        try:
+            yield
+        finally:
+            self.stages.append(measurement.finish(name=name))
+
+    def report(self, intervals: Optional[List[Dict]] = None) -> Dict:
+        """ملخص للنتائج (ويكتب ملف trace إن طُلب)"""
+        report = {
+            'stages': self.stages,
+            'intervals': intervals or [],
+            'children_peak_rss_mb': peak_rss_mb(children=True),
+        }
+        if self.profile_path:
+            report['profile'] = self.profile_path
+        if self.trace_path:
+            write_chrome_trace(self.trace_path, self.stages, intervals or [])
+            report['trace'] = self.trace_path
+        return report
+
+
+def write_chrome_trace(path: str, stages: List[Dict], intervals: List[Dict]):
+    """كتابة المراحل والفترات الفرعية كأحداث مكتملة ('X') بصيغة Chrome trace"""
+    events = []
+    for tid, records in ((0, stages), (1, intervals)):
+        for record in records:
+            name = record.get('name') or f"interval {record.get('interval')}"
+            args = {k: v for k, v in record.items()
+                    if k not in ('name', 'start', 'wall_s', 'pid')}
+            events.append({
+                'name': name, 'ph': 'X', 'pid': record['pid'], 'tid': tid,
+                'ts': record['start'] * 1e6, 'dur': record['wall_s'] * 1e6,
+                'args': args,
+            })
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
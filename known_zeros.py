@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+قاعدة بيانات الأصفار المعروفة
+Known-zeros reference database
+
+تستورد جداول الأصفار النصية (صفر في كل سطر، كجداول أودليزكو) وتخزنها
+مرتبة في ملف ثنائي: رأس ثابت ثم عمودان float64 متجاوران (hi, lo) بحيث
+hi + lo يمثل الصفر بدقة ~32 خانة (double-double). يُفتح الملف بـ np.memmap
+للقراءة فقط، والبحث عن أقرب صفر أو عن مدى يتم ببحث ثنائي O(log N).
+Imports plain-text zero tables, stores them sorted as a double-double
+(hi, lo) float64 column pair, and answers nearest-zero and range queries
+by binary search on the memory-mapped hi column.
+"""
+
+import os
+import struct
+import tempfile
+from decimal import Decimal, localcontext
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# أول خمسة أصفار غير تافهة (مرجع افتراضي مشترك بين الوحدات)
+FIRST_KNOWN_ZEROS = (14.134725142, 21.022039639, 25.010857580, 30.424876126, 32.935061588)
+
+_MAGIC = b'KNZEROS\0'
+_VERSION = 1
+# magic, version, count
+_HEADER = struct.Struct('<8sIQ')
+_HEADER_SIZE = 64
+
+
+class KnownZeros:
+    """جدول أصفار مرجعي مرتب - Sorted reference table of zeta zeros"""
+
+    def __init__(self, hi: np.ndarray, lo: Optional[np.ndarray] = None,
+                 path: Optional[str] = None):
+        self.hi = hi
+        self.lo = np.zeros_like(hi) if lo is None else lo
+        self.path = path
+
+    @classmethod
+    def from_values(cls, values: Sequence[float]) -> 'KnownZeros':
+        """جدول في الذاكرة من قائمة أصفار float64"""
+        return cls(np.sort(np.asarray(values, dtype=np.float64)))
+
+    @classmethod
+    def open(cls, path: str) -> 'KnownZeros':
+        """فتح جدول ثنائي بـ memmap للقراءة فقط"""
+        with open(path, 'rb') as f:
+            magic, version, count = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} ليس جدول أصفار صالحاً")
+        if count == 0:
+            return cls(np.empty(0), path=path)
+        hi = np.memmap(path, dtype=np.float64, mode='r', offset=_HEADER_SIZE, shape=(count,))
+        lo = np.memmap(path, dtype=np.float64, mode='r',
+                       offset=_HEADER_SIZE + 8 * count, shape=(count,))
+        return cls(hi, lo, path)
+
+    @classmethod
+    def import_text(cls, sources: Union[str, Iterable[str]], path: str,
+                    offset: str = '0') -> 'KnownZeros':
+        """استيراد ملفات نصية (صفر في كل سطر) إلى جدول ثنائي في path
+
+        offset يُضاف بدقة عشرية لكل سطر، لجداول الارتفاعات الكبيرة التي
+        تسرد الأصفار كإزاحات عن أساس (مثل جداول أودليزكو قرب 10^12).
+        الأسطر الفارغة والتي تبدأ بـ # تُتجاهل.
+        """
+        if isinstance(sources, str):
+            sources = [sources]
+        hi, lo = [], []
+        with localcontext() as ctx:
+            ctx.prec = 40
+            base = Decimal(offset)
+            for source in sources:
+                with open(source, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line or line.startswith('#'):
+                            continue
+                        value = base + Decimal(line.split()[0])
+                        h = float(value)
+                        hi.append(h)
+                        lo.append(float(value - Decimal(h)))
+
+        hi, lo = np.array(hi, dtype=np.float64), np.array(lo, dtype=np.float64)
+        order = np.lexsort((lo, hi))
+        cls._write(path, hi[order], lo[order])
+        return cls.open(path)
+
+    @staticmethod
+    def _write(path: str, hi: np.ndarray, lo: np.ndarray):
+        """كتابة ذرية: ملف مؤقت ثم os.replace"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, len(hi)).ljust(_HEADER_SIZE, b'\0'))
+                f.write(hi.tobytes())
+                f.write(lo.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __len__(self) -> int:
+        return len(self.hi)
+
+    def __getstate__(self):
+        if self.path is not None:
+            return {'path': self.path}
+        return {'hi': np.asarray(self.hi), 'lo': np.asarray(self.lo), 'path': None}
+
+    def __setstate__(self, state):
+        if state['path'] is not None:
+            self.__dict__.update(KnownZeros.open(state['path']).__dict__)
+        else:
+            self.__init__(state['hi'], state['lo'])
+
+    @property
+    def values(self) -> np.ndarray:
+        """الأصفار كمصفوفة float64 (الجزء hi)"""
+        return self.hi
+
+    def index_range(self, t_start: float, t_end: float) -> Tuple[int, int]:
+        """فهارس [i, j) للأصفار داخل [t_start, t_end]"""
+        i = int(np.searchsorted(self.hi, t_start, side='left'))
+        j = int(np.searchsorted(self.hi, t_end, side='right'))
+        return i, j
+
+    def in_range(self, t_start: float, t_end: float) -> np.ndarray:
+        """الأصفار داخل [t_start, t_end] (شريحة من memmap دون نسخ)"""
+        i, j = self.index_range(t_start, t_end)
+        return self.hi[i:j]
+
+    def nearest(self, t) -> Tuple[np.ndarray, np.ndarray]:
+        """أقرب صفر مرجعي لكل t: (الفهارس، المسافات t - zero بدقة double-double)"""
+        t = np.asarray(t, dtype=np.float64)
+        if len(self) == 0:
+            raise ValueError("جدول الأصفار فارغ")
+        idx = np.clip(np.searchsorted(self.hi, t), 1, max(len(self) - 1, 1))
+        left = np.maximum(idx - 1, 0)
+        right = np.minimum(idx, len(self) - 1)
+        d_left = (t - self.hi[left]) - self.lo[left]
+        d_right = (t - self.hi[right]) - self.lo[right]
+        use_right = np.abs(d_right) < np.abs(d_left)
+        return np.where(use_right, right, left), np.where(use_right, d_right, d_left)
+
+
+def compare_zeros(found: Sequence[float], reference: KnownZeros,
+                  T_range: Optional[Tuple[float, float]] = None,
+                  tolerance: float = 0.01) -> dict:
+    """مقارنة أصفار محسوبة بجدول مرجعي في O((K + Z) log) - Zero-list comparison
+
+    يُرتب كل تسلسل مرة واحدة، ثم يُبحث بحثاً ثنائياً عن أقرب صفر محسوب لكل
+    صفر مرجعي وبالعكس. صفر مرجعي بلا صفر محسوب ضمن tolerance "مفقود"،
+    وصفر محسوب بلا صفر مرجعي ضمنها "زائف". T_range يقصر المقارنة على المدى،
+    والأصفار المحسوبة خارج مدى الجدول المرجعي لا تُقارن (لا يُحكم بزيفها).
+    """
+    found = np.sort(np.asarray(found, dtype=np.float64))
+    if T_range is not None:
+        i, j = reference.index_range(*T_range)
+        found = found[(found >= T_range[0]) & (found <= T_range[1])]
+    else:
+        i, j = 0, len(reference)
+    if len(reference):
+        found = found[(found >= reference.hi[0] - tolerance)
+                      & (found <= reference.hi[-1] + tolerance)]
+    known = np.asarray(reference.hi[i:j])
+
+    result = {
+        'known_zeros': len(known),
+        'found_zeros': len(found),
+        'matches': 0,
+        'match_rate': 0.0,
+        'average_error': None,
+        'error_percentiles': None,
+        'missing_zeros': known.tolist() if len(found) == 0 else [],
+        'spurious_zeros': found.tolist() if len(known) == 0 else [],
+    }
+    if len(known) == 0 or len(found) == 0:
+        return result
+
+    # أقرب صفر محسوب لكل صفر مرجعي
+    idx = np.clip(np.searchsorted(found, known), 1, max(len(found) - 1, 1))
+    left = np.maximum(idx - 1, 0)
+    right = np.minimum(idx, len(found) - 1)
+    errors = np.minimum(np.abs(found[left] - known), np.abs(found[right] - known))
+    matched = errors < tolerance
+
+    # أقرب صفر مرجعي لكل صفر محسوب (ضمن المدى نفسه)
+    window = KnownZeros(reference.hi[i:j], reference.lo[i:j])
+    _, distances = window.nearest(found)
+
+    result.update({
+        'matches': int(matched.sum()),
+        'match_rate': float(matched.mean()),
+        'average_error': float(errors.mean()),
+        'missing_zeros': known[~matched].tolist(),
+        'spurious_zeros': found[np.abs(distances) >= tolerance].tolist(),
+    })
+    if matched.any():
+        p50, p90, p99 = np.percentile(errors[matched], [50, 90, 99])
+        result['error_percentiles'] = {'p50': float(p50), 'p90': float(p90),
+                                       'p99': float(p99),
+                                       'max': float(errors[matched].max())}
+    return result
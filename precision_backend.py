@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+الخلفيات العددية لحساب زيتا والأصفار
+Numeric backends for the zeta and zero-finding stack
+
+- 'float64': NumPy المتجه (الافتراضي).
+- 'mpmath': دقة اعتباطية بعدد dps من الخانات العشرية لكل التقييمات.
+- 'auto': float64 في كل مكان، مع تصعيد إلى mpmath للنقاط التي تقع
+  قيمتها ضمن خطأ float64 المقدر فقط، فتبقى كلفة الدقة العالية محصورة فيها.
+float64 NumPy, mpmath at a chosen dps, or 'auto' which escalates only
+the samples whose float64 sign is ambiguous.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+import riemann_siegel
+
+
+class Float64Backend:
+    """خلفية float64 المتجهة - Vectorized float64 backend"""
+
+    name = 'float64'
+    # الخلفية الأدق المستخدمة للنقاط الملتبسة (None: بلا تصعيد)
+    escalation: Optional['MpmathBackend'] = None
+
+    def prime_sum(self, s: np.ndarray, primes: np.ndarray, log_p: np.ndarray,
+                  sqrt_p: np.ndarray, memory_budget: int) -> np.ndarray:
+        """Σ √p·p^(-s) لمصفوفة s مسطحة: كتل exp(-s·ln p) @ √p على المحورين
+
+        الكتلة rows × cols (16 بايت لكل عنصر مركب) مع مخزن √p مركب بطول cols،
+        وكلاهما ضمن memory_budget مهما كبر جدول الأعداد الأولية؛ مجاميع كتل
+        الأعداد الأولية الجزئية تُجمع في النتيجة.
+        """
+        n = len(log_p)
+        result = np.zeros(s.shape, dtype=np.complex128)
+        if n == 0 or s.size == 0:
+            return result
+        cols = max(1, min(n, memory_budget // 32))
+        rows = max(1, min(s.size, memory_budget // (16 * cols) - 1))
+
+        buffer = np.empty((rows, cols), dtype=np.complex128)
+        # √p تبقى حقيقية؛ تُنسخ كتلة كتلة في الجزء الحقيقي لمخزن مركب واحد
+        weights = np.zeros(cols, dtype=np.complex128)
+        for c0 in range(0, n, cols):
+            c1 = min(c0 + cols, n)
+            w = weights[:c1 - c0]
+            w.real = sqrt_p[c0:c1]
+            for r0 in range(0, s.size, rows):
+                neg_s = -s[r0:r0 + rows]
+                terms = buffer[:len(neg_s), :c1 - c0]
+                np.multiply(neg_s[:, None], log_p[c0:c1], out=terms)
+                np.exp(terms, out=terms)
+                result[r0:r0 + len(neg_s)] += terms @ w
+        return result
+
+    def hardy_z(self, t):
+        return riemann_siegel.hardy_z(t)
+
+
+class MpmathBackend:
+    """خلفية mpmath بدقة dps خانة - Arbitrary-precision mpmath backend"""
+
+    escalation = None
+
+    def __init__(self, dps: int = 30):
+        self.dps = dps
+        self.name = f'mpmath:{dps}'
+        # استدعاءات siegelz داخل find_root (findroot لا يعيد عددها)
+        self.evaluations = 0
+
+    def prime_sum(self, s: np.ndarray, primes: np.ndarray, log_p: np.ndarray,
+                  sqrt_p: np.ndarray, memory_budget: int) -> np.ndarray:
+        """Σ p^(1/2 - s) من الأعداد الأولية الصحيحة (لا من ln p المقرّبة)"""
+        import mpmath
+        result = np.empty(s.shape, dtype=np.complex128)
+        with mpmath.workdps(self.dps):
+            ps = [mpmath.mpf(int(p)) for p in primes]
+            for i, si in enumerate(s.tolist()):
+                exponent = mpmath.mpf(0.5) - mpmath.mpc(si.real, si.imag)
+                result[i] = complex(mpmath.fsum(mpmath.power(p, exponent) for p in ps))
+        return result
+
+    def hardy_z(self, t):
+        """Z(t) عبر mpmath.siegelz عند كل t (قيمة float64 الممثلة تماماً)"""
+        import mpmath
+        t_arr = np.asarray(t, dtype=np.float64)
+        flat = t_arr.ravel()
+        with mpmath.workdps(self.dps):
+            values = np.array([float(mpmath.siegelz(mpmath.mpf(x))) for x in flat.tolist()])
+        values = values.reshape(t_arr.shape)
+        return values if values.ndim else float(values)
+
+    def find_root(self, low: float, high: float) -> Optional[float]:
+        """صفر Z داخل [low, high] بدقة dps، أو None إن لم تتغير الإشارة"""
+        import mpmath
+
+        def siegelz(t):
+            self.evaluations += 1
+            return mpmath.siegelz(t)
+
+        with mpmath.workdps(self.dps):
+            a, b = mpmath.mpf(low), mpmath.mpf(high)
+            if siegelz(a) * siegelz(b) > 0:
+                return None
+            return float(mpmath.findroot(siegelz, (a, b), solver='anderson'))
+
+
+class AutoBackend(Float64Backend):
+    """float64 مع تصعيد انتقائي إلى mpmath - float64 with selective escalation"""
+
+    def __init__(self, dps: int = 30):
+        self.escalation = MpmathBackend(dps)
+
+
+def get_backend(precision: str = 'float64', dps: int = 30):
+    """الخلفية المقابلة لاسم الدقة - Backend for a precision name"""
+    if precision == 'float64':
+        return Float64Backend()
+    if precision == 'mpmath':
+        return MpmathBackend(dps)
+    if precision == 'auto':
+        return AutoBackend(dps)
+    raise ValueError(f"دقة غير معروفة: {precision!r} (float64 أو mpmath أو auto)")
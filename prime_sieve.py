@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+غربال إراتوستينس المقطّع
+Segmented Sieve of Eratosthenes
+
+غربال للأعداد الفردية فقط على مقاطع بحجم ذاكرة L2، فتبقى الذاكرة
+العاملة ثابتة مهما كبر الحد، وتُعاد الأعداد الأولية كمصفوفة uint32
+(أو uint64 للحدود فوق 2^32).
+Odd-only segmented sieve: the working set is one L2-sized segment
+regardless of the limit; primes are returned as a compact uint32/uint64 array.
+"""
+
+from math import isqrt
+from typing import Iterator
+
+import numpy as np
+
+# حجم المقطع بالبايت (بايت لكل عدد فردي): ~1 MiB يناسب ذاكرة L2 الشائعة
+SEGMENT_BYTES = 2**20
+
+
+def prime_dtype(limit: int) -> np.dtype:
+    """أصغر نوع صحيح يتسع للأعداد الأولية حتى limit"""
+    return np.dtype(np.uint32) if limit < 2**32 else np.dtype(np.uint64)
+
+
+def _base_primes(limit: int) -> np.ndarray:
+    """الأعداد الأولية الفردية حتى limit (غربال بسيط للجذر التربيعي)"""
+    if limit < 3:
+        return np.empty(0, dtype=np.int64)
+    # الفهرس i يمثل العدد الفردي 2i + 1
+    is_prime = np.ones((limit + 1) // 2, dtype=bool)
+    is_prime[0] = False
+    for i in range(1, (isqrt(limit) + 1) // 2):
+        if is_prime[i]:
+            p = 2 * i + 1
+            is_prime[p * p // 2::p] = False
+    return 2 * np.flatnonzero(is_prime).astype(np.int64) + 1
+
+
+def iter_prime_segments(limit: int, segment_bytes: int = SEGMENT_BYTES,
+                        start: int = 0) -> Iterator[np.ndarray]:
+    """الأعداد الأولية في [start, limit] مقطعاً بعد مقطع بترتيب تصاعدي"""
+    dtype = prime_dtype(limit)
+    if limit < 2 or start > limit:
+        return
+    if start <= 2:
+        yield np.array([2], dtype=dtype)
+
+    base = _base_primes(isqrt(limit))
+    base_sq = base * base
+    # الفهرس i في الغربال يمثل العدد الفردي 2i + 1
+    first = max(start, 1) // 2
+    count = (limit + 1) // 2
+    for lo in range(first, count, segment_bytes):
+        hi = min(lo + segment_bytes, count)
+        segment = np.ones(hi - lo, dtype=bool)
+        if lo == 0:
+            segment[0] = False  # العدد 1
+
+        # أول مضاعف فردي لكل عدد أولي داخل المقطع، بدءاً من p²
+        lo_num = 2 * lo + 1
+        active = np.searchsorted(base_sq, 2 * hi - 1, side='right')
+        p = base[:active]
+        multiple = np.maximum(base_sq[:active], -(-lo_num // p) * p)
+        multiple += np.where(multiple % 2 == 0, p, 0)
+        # الخطوة p في فضاء الفهارس الفردية تقابل 2p في الأعداد
+        for prime, offset in zip(p.tolist(), ((multiple - 1) // 2 - lo).tolist()):
+            segment[offset::prime] = False
+
+        primes = 2 * (np.flatnonzero(segment) + lo) + 1
+        if lo == first and start > 2:
+            primes = primes[primes >= start]
+        yield primes.astype(dtype)
+
+
+def sieve_primes(limit: int, segment_bytes: int = SEGMENT_BYTES) -> np.ndarray:
+    """كل الأعداد الأولية حتى limit - All primes ≤ limit as a uint32/uint64 array"""
+    segments = list(iter_prime_segments(limit, segment_bytes))
+    if not segments:
+        return np.empty(0, dtype=prime_dtype(limit))
+    return np.concatenate(segments)
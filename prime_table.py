@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+جدول الأعداد الأولية الدائم على القرص
+Persistent memory-mapped prime table
+
+يُكتب الجدول مرة واحدة: رأس ثابت الحجم ثم ثلاثة أعمدة متجاورة
+(p، ln p، √p). بعدها تفتحه كل نسخة من TemporalNumberSystem بـ np.memmap
+للقراءة فقط، فتتشارك عمليات المجمع نفس صفحات الذاكرة بدلاً من نسخ خاصة.
+Written once as a fixed header followed by three contiguous columns
+(p, ln p, √p); later instances and pool workers map it read-only and
+share the same pages.
+"""
+
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from prime_sieve import iter_prime_segments, prime_dtype
+
+_MAGIC = b'TMPRIMES'
+_VERSION = 1
+# magic, version, itemsize of p, count, limit
+_HEADER = struct.Struct('<8sIIQQ')
+_HEADER_SIZE = 64
+
+
+class PrimeTable:
+    """جدول أعداد أولية مربوط بالذاكرة - Read-only memory-mapped prime table"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, version, itemsize, count, limit = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} ليس جدول أعداد أولية صالحاً")
+        self.count = count
+        self.limit = limit
+
+        dtype = np.dtype(np.uint32) if itemsize == 4 else np.dtype(np.uint64)
+        offsets = _column_offsets(count, itemsize)
+        self.primes = self._column(dtype, offsets[0])
+        self.log_primes = self._column(np.float64, offsets[1])
+        self.sqrt_primes = self._column(np.float64, offsets[2])
+
+    def _column(self, dtype, offset: int) -> np.ndarray:
+        if self.count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode='r', offset=offset,
+                         shape=(self.count,))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getstate__(self):
+        # لا تُنسخ الأعمدة عند إرسالها لعملية أخرى: تُفتح من نفس الملف
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    @classmethod
+    def build(cls, path: str, limit: int) -> 'PrimeTable':
+        """غربلة الأعداد الأولية حتى limit وكتابة الجدول بشكل ذري"""
+        segments = list(iter_prime_segments(limit))
+        count = sum(len(s) for s in segments)
+        itemsize = prime_dtype(limit).itemsize
+        offsets = _column_offsets(count, itemsize)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, itemsize, count, limit)
+                        .ljust(_HEADER_SIZE, b'\0'))
+                # عمود بعد عمود، مقطعاً بعد مقطع، دون نسخة كاملة ثانية في الذاكرة
+                for offset, column in zip(offsets, (None, np.log, np.sqrt)):
+                    f.seek(offset)
+                    for segment in segments:
+                        values = segment if column is None else column(segment.astype(np.float64))
+                        f.write(values.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o644)  # mkstemp ينشئ الملف للمالك فقط
+            # الاستبدال الذري: القراء يرون الجدول القديم أو الجديد كاملاً فقط
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return cls(path)
+
+    @classmethod
+    def open_or_build(cls, path: str, limit: int) -> 'PrimeTable':
+        """فتح الجدول إن كان يغطي limit، وإلا بناؤه من جديد"""
+        if os.path.exists(path):
+            try:
+                table = cls(path)
+                if table.limit >= limit:
+                    return table
+            except (ValueError, struct.error):
+                pass  # ملف تالف أو من إصدار آخر: يُعاد بناؤه
+        return cls.build(path, limit)
+
+    def up_to(self, limit: int) -> int:
+        """عدد الأعداد الأولية ≤ limit في الجدول"""
+        return int(np.searchsorted(self.primes, limit, side='right'))
+
+
+def _column_offsets(count: int, itemsize: int):
+    """إزاحات الأعمدة الثلاثة (كل عمود يبدأ عند حد 8 بايت)"""
+    primes_offset = _HEADER_SIZE
+    log_offset = primes_offset + -(-count * itemsize // 8) * 8
+    sqrt_offset = log_offset + 8 * count
+    return primes_offset, log_offset, sqrt_offset
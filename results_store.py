@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+تخزين النتائج بصيغة عمودية
+Columnar results storage
+
+حاوية .npz غير مضغوطة: كل قائمة أرقام أو مصفوفة في النتائج (الأصفار،
+الانحرافات، بيانات المقارنة...) تُكتب عموداً .npy مستقلاً، وبقية النتائج
+(الإعدادات، الثوابت، الإحصاءات) في manifest.json صغير داخل الحاوية نفسها
+يحمل مكان كل عمود. لأن الأعضاء مخزنة بلا ضغط، تُربط الأعمدة بالذاكرة
+مباشرة من إزاحتها داخل الملف، فلا يُقرأ عند التحميل إلا البيان.
+Numeric arrays go into separate uncompressed .npy members of an .npz and
+everything else into a small JSON manifest; loading memory-maps each
+column in place, so only the manifest is parsed.
+"""
+
+import json
+import os
+import struct
+import tempfile
+import zipfile
+from numbers import Number
+from typing import Any, Dict
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+MANIFEST_NAME = 'manifest.json'
+FORMAT_VERSION = 1
+# ترويسة الملف المحلية في ZIP: 30 بايت، طول الاسم عند 26 وطول الإضافي عند 28
+_LOCAL_HEADER = struct.Struct('<4s22xHH')
+
+
+def _is_column(value: Any) -> bool:
+    """مصفوفة رقمية، أو قائمة غير فارغة كل عناصرها أرقام"""
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in 'biuf'
+    return (isinstance(value, (list, tuple)) and len(value) > 0
+            and all(isinstance(v, Number) and not isinstance(v, complex) for v in value))
+
+
+def _split(value: Any, key: str, columns: Dict[str, np.ndarray]) -> Any:
+    """استبدال الأعمدة بمراجع {'__column__': key} وجمعها في columns"""
+    if isinstance(value, dict):
+        return {k: _split(v, f'{key}/{k}' if key else str(k), columns)
+                for k, v in value.items()}
+    if _is_column(value):
+        columns[key] = np.asarray(value)
+        return {'__column__': key}
+    if isinstance(value, (list, tuple)):
+        return [_split(v, f'{key}/{i}', columns) for i, v in enumerate(value)]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _join(value: Any, columns: Dict[str, np.ndarray]) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {'__column__'}:
+            return columns[value['__column__']]
+        return {k: _join(v, columns) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_join(v, columns) for v in value]
+    return value
+
+
+def save_columnar(results: Dict, path: str):
+    """كتابة النتائج في حاوية .npz عمودية (كتابة ذرية)"""
+    columns: Dict[str, np.ndarray] = {}
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'results': _split(results, '', columns),
+        'columns': {},
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f, \
+                zipfile.ZipFile(f, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for i, (key, array) in enumerate(columns.items()):
+                member = f'c{i}.npy'
+                manifest['columns'][key] = member
+                with zf.open(member, 'w', force_zip64=True) as out:
+                    npy_format.write_array(out, np.ascontiguousarray(array),
+                                           allow_pickle=False)
+            zf.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2))
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _map_member(path: str, f, zf: zipfile.ZipFile, member: str) -> np.ndarray:
+    """ربط عضو .npy غير مضغوط بالذاكرة من إزاحته داخل الحاوية"""
+    info = zf.getinfo(member)
+    if info.compress_type != zipfile.ZIP_STORED:
+        with zf.open(member) as src:
+            return npy_format.read_array(src, allow_pickle=False)
+
+    f.seek(info.header_offset)
+    signature, name_len, extra_len = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+    if signature != b'PK\x03\x04':
+        raise ValueError(f"{path}: ترويسة ZIP تالفة للعضو {member}")
+    f.seek(info.header_offset + _LOCAL_HEADER.size + name_len + extra_len)
+    version = npy_format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = npy_format.read_array_header_1_0(f)
+    else:
+        shape, fortran_order, dtype = npy_format.read_array_header_2_0(f)
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def load_columnar(path: str) -> Dict:
+    """تحميل حاوية عمودية؛ الأعمدة مصفوفات memmap للقراءة فقط"""
+    with open(path, 'rb') as f, zipfile.ZipFile(f) as zf:
+        manifest = json.loads(zf.read(MANIFEST_NAME).decode('utf-8'))
+        if manifest.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"{path}: إصدار صيغة نتائج غير مدعوم")
+        columns = {key: _map_member(path, f, zf, member)
+                   for key, member in manifest['columns'].items()}
+    return _join(manifest['results'], columns)
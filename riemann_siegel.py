@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+محرك ريمان-سيغل لدالة هاردي Z(t)
+Riemann–Siegel Engine for Hardy's Z-function
+
+يحسب Z(t) الحقيقية على الخط الحرج بتكلفة O(√t) لكل نقطة، مع
+حدود التصحيح C0..C4، ويعمل على مصفوفات t مباشرة.
+Computes the real-valued Z(t) on the critical line at O(√t) cost per
+point, including the C0..C4 remainder corrections, on vectors of t.
+"""
+
+import numpy as np
+from typing import Union
+
+ArrayLike = Union[float, np.ndarray]
+
+# معاملات تايلور لحدود التصحيح C0..C4 بقوى z = 2p - 1 (حسبت بـ mpmath بدقة 80 خانة)
+# C0, C2, C4 دوال زوجية في z والمعاملات بقوى z²؛
+# C1, C3 دوال فردية: C(z) = z · Σ a_k z^(2k)
+# Taylor coefficients of the Riemann–Siegel corrections in powers of z = 2p - 1
+_RS_COEFFICIENTS = (
+    # C0
+    (
+        3.8268343236508977173e-1, 4.3724046807752044936e-1, 1.3237657548034352332e-1,
+        -1.3605026047674188655e-2, -1.3567621970103580888e-2, -1.6237253231444652829e-3,
+        2.9705353733379690783e-4, 7.943300879521469588e-5, 4.6556124614504505037e-7,
+        -1.4327251630955105754e-6, -1.0354847112312946075e-7, 1.2357927083861738056e-8,
+        1.7881083857954904986e-9, -3.3914143899270359069e-11, -1.6326633902565905101e-11,
+        -3.7851093185412203829e-13, 9.3274232592017248457e-14, 5.2218430159781368553e-15,
+        -3.3506730727442637895e-16, -3.4124265228117264941e-17, 5.7512033414323991603e-19,
+        1.4895301363211505455e-19,
+    ),
+    # C1
+    (
+        -2.682510262837534703e-2, 1.378477342635185305e-2, 3.8491250482235082229e-2,
+        9.871066299062076472e-3, -3.3107597608584043329e-3, -1.4647808577954150825e-3,
+        -1.3207940624876963675e-5, 5.9227487018471413232e-5, 5.9802425853734485877e-6,
+        -9.6413224561698263527e-7, -1.833473372271441176e-7, 4.4670875627178335996e-9,
+        2.7096350821772743217e-9, 7.7852886543158510463e-11, -2.3437626010893688532e-11,
+        -1.5830172789987521642e-12, 1.2119941573723791247e-13, 1.4583781161108307018e-14,
+        -2.8786305258131917505e-16, -8.6628629021237241225e-17, -8.4307227271370412716e-19,
+        3.6308072230973462002e-19,
+    ),
+    # C2
+    (
+        5.1885428302931684938e-3, 3.0946583880634746033e-4, -1.1335941078229373382e-2,
+        2.2330457419581447721e-3, 5.1966374088623302051e-3, 3.4399144076208336695e-4,
+        -5.9106484274705828217e-4, -1.0229972547935857454e-4, 2.0888392216992755408e-5,
+        5.9276654930965359579e-6, -1.6423838362436275978e-7, -1.5161199700940682862e-7,
+        -5.9078036982066679629e-9, 2.0911514859478188978e-9, 1.7815649583292351054e-10,
+        -1.6164072455353830753e-11, -2.3806962496667615707e-12, 5.3982652955425949182e-14,
+        1.9750142196969515273e-14, 2.3332868732882634831e-16, -1.1187517610048080208e-16,
+        -4.1640094888837671885e-18, 4.4460811092918830289e-19,
+    ),
+    # C3
+    (
+        -1.3397160907194569043e-3, 3.7442151363793937047e-3, -1.330317891932146812e-3,
+        -2.2654660765471787115e-3, 9.5484999985067304151e-4, 6.0100384589636039121e-4,
+        -1.0128858286776621953e-4, -6.8657334492998256425e-5, 5.9853667915385981593e-7,
+        3.331659851239947129e-6, 2.1919289102435081057e-7, -7.8908842456814944106e-8,
+        -9.4146850812952621517e-9, 9.5701162108834803019e-10, 1.8763137453470662797e-10,
+        -4.4378376793233993275e-12, -2.2426738505617353248e-12, -3.6276868657352436894e-14,
+        1.7639809550821581608e-14, 7.9607652467867777573e-16, -9.4196514905896907639e-17,
+        -7.1331038545696578246e-18, 3.2899105845546243212e-19,
+    ),
+    # C4
+    (
+        4.6483389361763381854e-4, -1.005660736534047076e-3, 2.4044856573725793022e-4,
+        1.0283086149702321878e-3, -7.6578610717556441866e-4, -2.0365286803084817621e-4,
+        2.3212290491068727895e-4, 3.2602144243865197608e-5, -2.557906251794952514e-5,
+        -4.107464438915744754e-6, 1.1781113640371293881e-6, 2.4456561422484578542e-7,
+        -2.391582476734432243e-8, -7.5052142070357552885e-9, 1.3312279416258428193e-10,
+        1.3440626754225619719e-10, 3.5137700424304859287e-12, -1.5191544533703919336e-12,
+        -8.9154176814470873055e-14, 1.1195891165228535773e-14, 1.0516013329914814964e-15,
+        -5.1786552736466836615e-17, -8.0658748619165660515e-18, 1.060820453056396595e-19,
+    ),
+)
+
+# تحت هذا الارتفاع نستخدم loggamma بدلاً من متسلسلة ستيرلنغ لـ θ(t)
+_THETA_ASYMPTOTIC_MIN = 10.0
+
+
+def theta(t: ArrayLike) -> ArrayLike:
+    """دالة ريمان-سيغل θ(t) - Riemann–Siegel theta function"""
+    t = np.asarray(t, dtype=np.float64)
+    result = np.empty_like(t)
+
+    large = t >= _THETA_ASYMPTOTIC_MIN
+    tl = t[large]
+    # متسلسلة ستيرلنغ: خطأ أقل من 1e-10 عند t ≥ 10
+    result[large] = (tl / 2 * np.log(tl / (2 * np.pi)) - tl / 2 - np.pi / 8
+                     + 1 / (48 * tl) + 7 / (5760 * tl**3) + 31 / (80640 * tl**5))
+
+    ts = t[~large]
+    if ts.size:
+        from scipy.special import loggamma  # تحميل scipy عند الحاجة فقط
+        result[~large] = np.imag(loggamma(0.25 + 0.5j * ts)) - ts / 2 * np.log(np.pi)
+
+    return result if result.ndim else float(result)
+
+
+def remainder(t: np.ndarray) -> np.ndarray:
+    """حد الباقي في صيغة ريمان-سيغل - Riemann–Siegel remainder R(t)"""
+    a = np.sqrt(t / (2 * np.pi))
+    N = np.floor(a)
+    z = 2 * (a - N) - 1
+    z2 = z * z
+
+    # Σ C_k(z) · (2π/t)^(k/2)
+    inv_a = 1.0 / a
+    series = np.zeros_like(t)
+    scale = np.ones_like(t)
+    for k, coeffs in enumerate(_RS_COEFFICIENTS):
+        c_k = np.polynomial.polynomial.polyval(z2, coeffs)
+        if k % 2:
+            c_k = c_k * z
+        series += c_k * scale
+        scale = scale * inv_a
+
+    sign = np.where(N % 2 == 1, 1.0, -1.0)  # (-1)^(N-1)
+    return sign * series / np.sqrt(a)
+
+
+def hardy_z(t: ArrayLike, memory_budget: int = 64 * 2**20) -> ArrayLike:
+    """دالة هاردي Z(t) - Hardy Z-function via the Riemann–Siegel formula
+
+    Z(t) = 2 Σ_{n≤N} n^(-1/2) cos(θ(t) - t ln n) + R(t),  N = ⌊√(t/2π)⌋
+
+    حقيقية القيمة وأصفارها هي أصفار ζ(1/2 + it)، لذا يكفي البحث عن
+    تغير الإشارة. صالحة لـ t ≥ 2π؛ الخطأ ~1e-6 عند t ≈ 14 وينخفض إلى
+    ~1e-11 قرب t ≈ 1000، ثم يحده خطأ الطور في float64 (~1e-7 عند t = 1e8).
+    """
+    t_arr = np.asarray(t, dtype=np.float64)
+    flat = t_arr.ravel()
+    result = np.empty_like(flat)
+    if flat.size == 0:
+        return result.reshape(t_arr.shape)
+    if np.any(flat < 2 * np.pi):
+        raise ValueError("صيغة ريمان-سيغل تتطلب t ≥ 2π")
+
+    th = theta(flat)
+    N = np.floor(np.sqrt(flat / (2 * np.pi))).astype(np.int64)
+
+    # كتل من الصفوف بحيث لا تتجاوز مصفوفة الحدود (8 بايت) وقناع القطع
+    # (بايت واحد) memory_budget؛ الطور وجيبه والقسمة تُحسب في مخزن واحد
+    n_max = int(N.max())
+    chunk = max(1, min(flat.size, memory_budget // (9 * n_max)))
+    buffer = np.empty((chunk, n_max))
+    for start in range(0, flat.size, chunk):
+        stop = min(start + chunk, flat.size)
+        width = int(N[start:stop].max())
+        n = np.arange(1, width + 1, dtype=np.float64)
+
+        terms = buffer[:stop - start, :width]
+        np.multiply(flat[start:stop, None], -np.log(n), out=terms)
+        terms += th[start:stop, None]
+        np.cos(terms, out=terms)
+        terms /= np.sqrt(n)
+        terms[n > N[start:stop, None]] = 0.0
+        result[start:stop] = 2 * terms.sum(axis=1)
+
+    result += remainder(flat)
+    result = result.reshape(t_arr.shape)
+    return result if result.ndim else float(result)
+
+
+def hardy_z_error(t: ArrayLike) -> ArrayLike:
+    """تقدير تجريبي لخطأ hardy_z في float64 - Empirical float64 error estimate
+    
+    مجموع خطأ قطع المتسلسلة بعد C4 (~0.005·t^(-5/2)) وخطأ تقريب الطور
+    t·ln(n) في float64 (~2ε·t·ln(t/2π)·√(2 ln N + 1))، مُعايَر على mpmath.siegelz.
+    """
+    t = np.asarray(t, dtype=np.float64)
+    N = np.maximum(np.floor(np.sqrt(t / (2 * np.pi))), 1.0)
+    phase = 2 * np.finfo(np.float64).eps * t * np.log(t / (2 * np.pi)) \
+        * np.sqrt(2 * np.log(N) + 1)
+    result = 0.005 * t ** -2.5 + phase
+    return result if result.ndim else float(result)
+
+
+def zeta_critical_line(t: ArrayLike) -> ArrayLike:
+    """ζ(1/2 + it) = Z(t) · e^(-iθ(t)) - Zeta on the critical line"""
+    return hardy_z(t) * np.exp(-1j * np.asarray(theta(t)))
+
+
+def gram_point(n: ArrayLike) -> ArrayLike:
+    """نقاط غرام g_n حيث θ(g_n) = nπ - Gram points (n ≥ -1, may be fractional)
+
+    تخمين أولي من θ(t) ≈ (t/2)ln(t/2πe) - π/8 بدالة لامبرت ثم نيوتن.
+    """
+    from scipy.special import lambertw
+    n = np.asarray(n, dtype=np.float64)
+    t = 2 * np.pi * np.exp(1 + np.real(lambertw((8 * n + 1) / (8 * np.e))))
+    for _ in range(50):
+        # θ'(t) ≈ ln(t/2π)/2
+        delta = (theta(t) - n * np.pi) / (0.5 * np.log(t / (2 * np.pi)))
+        t = t - delta
+        if np.all(np.abs(delta) <= 4e-16 * t):
+            break
+    return t if t.ndim else float(t)
+
+
+def turing_block_count(g: ArrayLike) -> ArrayLike:
+    """عدد كتل تورنغ اللازم (صيغة برنت) - Brent's Turing block count
+
+    K = ⌈0.0061·ln²(g) + 0.08·ln(g)⌉ حيث g نقطة غرام الخارجية لاتحاد الكتل
+    (اللوغاريتم الطبيعي لـ g نفسها لا لـ g/2π): 2 عند 1e4، 3 عند 1e6، 6 عند 1e10.
+    """
+    log_g = np.log(np.asarray(g, dtype=np.float64))
+    K = np.ceil(0.0061 * log_g ** 2 + 0.08 * log_g).astype(np.int64)
+    return K if K.ndim else int(K)
@@ -12,18 +12,40 @@ Date: 2025-07-25
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import integrate, optimize
-from scipy.special import zeta
-import cmath
 import time
-from typing import List, Tuple, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import riemann_siegel
+from odlyzko_schonhage import OdlyzkoSchonhage
+from search_checkpoint import SearchCheckpoint
+from evaluation_cache import EvaluationCache
+from prime_sieve import iter_prime_segments, sieve_primes
+from prime_table import PrimeTable
+from precision_backend import get_backend
+from certified_zeros import certify_zeros
+from known_zeros import FIRST_KNOWN_ZEROS, KnownZeros, compare_zeros
+from zero_sink import ListSink, ZeroSink, load_zeros, open_sink
+from results_store import load_columnar, save_columnar
+from instrumentation import Instrumentation, Measurement
+
+ArrayLike = Union[float, np.ndarray]
+
+# أقصى عدد نقاط تُرسم لكل سلسلة قبل اختزال min/max
+DECIMATE_POINTS = 10_000
+
+# أقصى عدد نقاط مسح في الفترة الفرعية للبحث المتسلسل (ذاكرة ثابتة للمدى الطويل)
+SHARD_POINTS = 2**18
+
+# أقصى عرض لنافذة الغربال في is_prime (بايت لكل عدد في القناع)
+PRIME_WINDOW = 2**20
 
 class TemporalNumberSystem:
     """نظام الأعداد الزمني - Temporal Number System"""
     
-    def __init__(self):
+    def __init__(self, prime_limit: int = 10000, prime_table: Optional[str] = None):
         # الثوابت الأساسية - Fundamental Constants
         self.k_B = 1.380649e-23  # ثابت بولتزمان
         self.hbar = 1.054571817e-34  # ثابت بلانك المخفض
@@ -35,65 +57,302 @@ class TemporalNumberSystem:
         # معامل المقاومة من نظرية الفتائل
         self.beta = np.sqrt(2 * np.pi)  # ≈ 2.507
         
-        # قاعدة بيانات الأعداد الأولية
-        self.primes = self._generate_primes(10000)
+        # قاعدة بيانات الأعداد الأولية (مصفوفة uint32/uint64 مرتبة)
+        # prime_table: ملف جدول دائم يُبنى مرة ثم يُفتح بـ memmap للقراءة فقط
+        self.prime_limit = prime_limit
+        self.prime_table = None
+        if prime_table is not None:
+            self.prime_table = PrimeTable.open_or_build(prime_table, prime_limit)
+            self.primes = self.prime_table.primes[:self.prime_table.up_to(prime_limit)]
+        else:
+            self.primes = self._generate_primes(prime_limit)
         
-    def _generate_primes(self, limit: int) -> List[int]:
-        """توليد الأعداد الأولية حتى حد معين"""
-        sieve = [True] * (limit + 1)
-        sieve[0] = sieve[1] = False
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.prime_table is not None:
+            # العمليات الفرعية تعيد فتح الجدول من مساره بدلاً من نسخ الأعمدة
+            state['primes'] = len(self.primes)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.prime_table is not None:
+            self.primes = self.prime_table.primes[:state['primes']]
         
-        for i in range(2, int(limit**0.5) + 1):
-            if sieve[i]:
-                for j in range(i*i, limit + 1, i):
-                    sieve[j] = False
-                    
-        return [i for i in range(2, limit + 1) if sieve[i]]
+    def _generate_primes(self, limit: int) -> np.ndarray:
+        """توليد الأعداد الأولية حتى حد معين (غربال مقطّع للأعداد الفردية)"""
+        return sieve_primes(limit)
     
-    def birth_time(self, n: int) -> float:
+    # كل الدوال التالية تقبل عدداً أو مصفوفة وتعيد نفس الشكل
+    def birth_time(self, n: ArrayLike) -> ArrayLike:
         """حساب زمن ولادة العدد - Calculate birth time of number"""
-        return np.log(n)
+        return _scalar_or_array(np.log(np.asarray(n, dtype=np.float64)))
     
-    def natural_frequency(self, n: int) -> float:
+    def natural_frequency(self, n: ArrayLike) -> ArrayLike:
         """التردد الطبيعي للعدد - Natural frequency of number"""
-        return 1.0 / np.sqrt(n)
+        return _scalar_or_array(1.0 / np.sqrt(np.asarray(n, dtype=np.float64)))
     
-    def resistance(self, n: int) -> float:
+    def resistance(self, n: ArrayLike) -> ArrayLike:
         """مقاومة العدد - Number resistance"""
-        return self.beta * np.sqrt(n)
+        return _scalar_or_array(self.beta * np.sqrt(np.asarray(n, dtype=np.float64)))
     
-    def capacitance(self, n: int) -> float:
+    def capacitance(self, n: ArrayLike) -> ArrayLike:
         """سعة العدد - Number capacitance"""
-        return 1.0 / (self.k_B * np.log(n)) if n > 1 else 1.0
+        n = np.asarray(n, dtype=np.float64)
+        above_one = n > 1
+        # 1/(k_B·ln n) في مصفوفة واحدة؛ خارج القناع تبقى القيمة 1
+        result = np.ones(n.shape)
+        np.log(n, out=result, where=above_one)
+        np.multiply(result, self.k_B, out=result, where=above_one)
+        np.divide(1.0, result, out=result, where=above_one)
+        return _scalar_or_array(result)
     
-    def inductance(self, n: int) -> float:
+    def inductance(self, n: ArrayLike) -> ArrayLike:
         """محاثة العدد - Number inductance"""
-        return n * self.t_p
+        return _scalar_or_array(np.asarray(n, dtype=np.float64) * self.t_p)
+    
+    def is_prime(self, n: ArrayLike) -> ArrayLike:
+        """اختبار الأولية عبر أقنعة غربال لنوافذ تغطي قيم n فقط
+        
+        القيم المرتبة تُجمع في نوافذ عرضها PRIME_WINDOW على الأكثر، فالذاكرة
+        والغربلة تتبعان القيم المطلوبة لا max(n).
+        """
+        n = np.asarray(n, dtype=np.int64)
+        flat = n.ravel()
+        if np.all(flat[1:] > flat[:-1]):
+            values, inverse = flat, None  # مدى متصل أو مرتب: بلا فرز
+        else:
+            values, inverse = np.unique(flat, return_inverse=True)
+        
+        result = np.zeros(values.size, dtype=bool)
+        start = int(np.searchsorted(values, 2))
+        while start < values.size:
+            lo = int(values[start])
+            stop = int(np.searchsorted(values, lo + PRIME_WINDOW))
+            mask = self.prime_mask(lo, int(values[stop - 1]) + 1)
+            result[start:stop] = mask[values[start:stop] - lo]
+            start = stop
+        if inverse is not None:
+            result = result[inverse.reshape(-1)]
+        result = result.reshape(n.shape)
+        return result if result.ndim else bool(result)
+    
+    def prime_mask(self, lo: int, hi: int) -> np.ndarray:
+        """قناع الأولية للأعداد [lo, hi) (lo ≥ 2) بغربال مقطّع للنافذة نفسها"""
+        if hi - 1 <= self.prime_limit:
+            primes = self.primes
+            primes = primes[np.searchsorted(primes, lo):np.searchsorted(primes, hi)]
+        else:
+            primes = np.concatenate(list(iter_prime_segments(hi - 1, start=lo)) or
+                                    [np.empty(0, dtype=np.int64)])
+        mask = np.zeros(hi - lo, dtype=bool)
+        mask[primes.astype(np.int64) - lo] = True
+        return mask
+    
+    def properties(self, n_array: ArrayLike, block: int = 2**12,
+                   fields: Optional[Sequence[str]] = None) -> np.ndarray:
+        """كل خصائص الأعداد في مصفوفة مهيكلة واحدة - Structured per-number table
+        
+        fields يحدد حقولاً من NUMBER_PROPERTIES_DTYPE (بترتيبها المعطى)
+        فلا يُحسب غيرها؛ None يعني كل الحقول.
+        """
+        names = NUMBER_PROPERTIES_DTYPE.names if fields is None else tuple(fields)
+        n = np.asarray(n_array, dtype=np.int64).ravel()
+        table = np.empty(n.size, dtype=[(name, NUMBER_PROPERTIES_DTYPE[name])
+                                        for name in names])
+        is_prime = self.is_prime(n) if 'is_prime' in names else None
+        # كتل صفوف تبقى في الذاكرة المخبئية أثناء كتابة الحقول المتباعدة
+        for start in range(0, n.size, block):
+            rows = table[start:start + block]
+            m = n[start:start + block]
+            frequency = self.natural_frequency(m)
+            resistance = self.resistance(m)
+            for name in names:
+                if name == 'n':
+                    rows[name] = m
+                elif name == 'natural_frequency':
+                    rows[name] = frequency
+                elif name == 'resistance':
+                    rows[name] = resistance
+                elif name == 'quality_factor':
+                    # معامل الجودة Q = f/R (صفر حيث لا مقاومة)
+                    rows[name] = np.divide(frequency, resistance,
+                                           out=np.zeros(m.size), where=resistance > 0)
+                elif name == 'is_prime':
+                    rows[name] = is_prime[start:start + block]
+                else:  # birth_time و capacitance و inductance
+                    rows[name] = getattr(self, name)(m)
+        return table
+
+
+# أعمدة TemporalNumberSystem.properties
+NUMBER_PROPERTIES_DTYPE = np.dtype([
+    ('n', np.int64),
+    ('birth_time', np.float64),
+    ('natural_frequency', np.float64),
+    ('resistance', np.float64),
+    ('capacitance', np.float64),
+    ('inductance', np.float64),
+    ('quality_factor', np.float64),
+    ('is_prime', np.bool_),
+])
+
+
+def _scalar_or_array(result: np.ndarray) -> ArrayLike:
+    """عدد عادي للمدخل العددي، ومصفوفة لغير ذلك"""
+    return result if result.ndim else float(result)
 
 class TemporalZetaFunction:
     """دالة زيتا الزمنية - Temporal Zeta Function"""
     
-    def __init__(self, number_system: TemporalNumberSystem):
+    def __init__(self, number_system: TemporalNumberSystem,
+                 memory_budget: int = 64 * 2**20,
+                 cache_size: int = 0,
+                 cache_path: Optional[str] = None,
+                 precision: str = 'float64',
+                 dps: int = 30):
         self.ns = number_system
+        # الحد الأقصى للذاكرة (بالبايت) لكتلة exp(-s·ln p) في evaluate_grid
+        self.memory_budget = memory_budget
+        # الخلفية العددية: float64 أو mpmath (بدقة dps) أو auto
+        self.set_precision(precision, dps)
+        # عدد النقاط المطلوب تقييمها (من الذاكرة المؤقتة أو بالحساب)
+        self.evaluations = 0
+        
+        # ذاكرة مؤقتة اختيارية للقيم: LRU بحجم cache_size وطبقة SQLite في cache_path
+        self.cache = None
+        if cache_size > 0 or cache_path is not None:
+            self.cache = EvaluationCache(cache_size, cache_path)
+        
+        # جداول مخزنة مسبقاً: ln(p) و √p لكل عدد أولي (مرتبة تصاعدياً)
+        self._load_prime_columns()
+    
+    def set_precision(self, precision: str = 'float64', dps: int = 30):
+        """اختيار الخلفية العددية - Select the numeric backend"""
+        self.backend = get_backend(precision, dps)
+        self.precision_mode = precision
+        # جزء من مفتاح الذاكرة المؤقتة: قيم كل دقة تُخزن منفصلة
+        # (auto يشارك float64 قيمها لأن التصعيد لا يمر عبر الذاكرة المؤقتة)
+        self.precision = self.backend.name
+    
+    def _load_prime_columns(self):
+        table = self.ns.prime_table
+        if table is not None:
+            # أعمدة الجدول الدائم مباشرة (memmap مشترك بين العمليات)
+            n = len(self.ns.primes)
+            self._log_primes = table.log_primes[:n]
+            self._sqrt_primes = table.sqrt_primes[:n]
+        else:
+            primes = np.asarray(self.ns.primes, dtype=np.float64)
+            self._log_primes = np.log(primes)
+            self._sqrt_primes = np.sqrt(primes)
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.ns.prime_table is not None:
+            del state['_log_primes'], state['_sqrt_primes']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if '_log_primes' not in state:
+            self._load_prime_columns()
         
-    def time_density_function(self, tau: float) -> complex:
-        """دالة الكثافة الزمنية - Time density function"""
-        density = 0.0
+    def time_density_function(self, tau: ArrayLike) -> ArrayLike:
+        """دالة الكثافة الزمنية - Time density function
         
-        for p in self.ns.primes:
-            tau_p = self.ns.birth_time(p)
-            if abs(tau - tau_p) < 1e-10:  # دلتا ديراك التقريبية
-                density += np.sqrt(p)
-                
-        return density
+        Σ √p على الأعداد الأولية التي |τ - ln p| < 1e-10 (دلتا ديراك التقريبية).
+        بحث ثنائي في جدول ln(p) المرتب بدلاً من المرور على كل الأعداد
+        الأولية، ويقبل τ عدداً أو مصفوفة.
+        """
+        tau = np.asarray(tau, dtype=np.float64)
+        flat = tau.ravel()
+        # حدود النافذة المفتوحة (τ - 1e-10, τ + 1e-10) في الجدول
+        lo = np.searchsorted(self._log_primes, flat - 1e-10, side='right')
+        hi = np.searchsorted(self._log_primes, flat + 1e-10, side='left')
+        
+        density = np.zeros(flat.shape)
+        counts = hi - lo
+        single = counts == 1
+        density[single] = self._sqrt_primes[lo[single]]
+        # النافذة لا تسع أكثر من عدد أولي واحد إلا عند p ≳ 10^10
+        for i in np.flatnonzero(counts > 1):
+            density[i] = self._sqrt_primes[lo[i]:hi[i]].sum()
+        
+        return _scalar_or_array(density.reshape(tau.shape))
+    
+    def prime_sum(self, sigma: float, T: float, max_tau: float = 50.0) -> complex:
+        """المجموع الأولي المتقطع - Exact prime sum Σ_p √p·p^(-σ)·e^(-iT log p)
+        
+        هذا هو التكامل المعرّف بمشط دلتا في time_density_function محسوباً
+        بدقة: كل نبضة عند τ = ln(p) ضمن [0, max_tau] تساهم بحد واحد.
+        """
+        # الأعداد الأولية التي يقع زمن ولادتها داخل مجال التكامل
+        n = np.searchsorted(self._log_primes, max_tau, side='right')
+        self.evaluations += 1
+        # صف واحد عبر نواة evaluate_grid نفسها، فيشمله memory_budget
+        return complex(self._grid_sum(np.array([sigma + 1j * T]), n)[0])
+    
+    def evaluate_grid(self, sigmas, Ts, max_tau: float = 50.0,
+                      memory_budget: Optional[int] = None) -> np.ndarray:
+        """تقييم دالة زيتا الزمنية على شبكة - Batched evaluation over (σ, T) arrays
+        
+        sigmas و Ts تُبث (broadcast) معاً، والنتيجة مصفوفة مركبة بنفس الشكل.
+        كل كتلة تحسب كضرب مصفوفي واحد exp(-s·ln p) @ √p، مقسمة بحيث
+        لا تتجاوز مصفوفة الحدود memory_budget بايت.
+        """
+        sigmas, Ts = np.broadcast_arrays(np.asarray(sigmas, dtype=np.float64),
+                                         np.asarray(Ts, dtype=np.float64))
+        self.evaluations += sigmas.size
+        n = np.searchsorted(self._log_primes, max_tau, side='right')
+        result = self._cached(f'prime_sum:{max_tau}:{n}', sigmas.ravel(), Ts.ravel(),
+                              lambda sig, T: self._grid_sum(sig + 1j * T, n, memory_budget))
+        return result.reshape(sigmas.shape)
+    
+    def _grid_sum(self, s: np.ndarray, n: int,
+                  memory_budget: Optional[int] = None) -> np.ndarray:
+        """Σ_{p ≤ p_n} √p·p^(-s) لمصفوفة s مسطحة (عبر الخلفية العددية)"""
+        budget = self.memory_budget if memory_budget is None else memory_budget
+        return self.backend.prime_sum(s, self.ns.primes[:n], self._log_primes[:n],
+                                      self._sqrt_primes[:n], budget)
     
-    def temporal_zeta(self, sigma: float, T: float, max_tau: float = 50.0) -> complex:
-        """حساب دالة زيتا الزمنية"""
+    def _cached(self, backend: str, sigmas: np.ndarray, Ts: np.ndarray,
+                compute) -> np.ndarray:
+        """تقييم compute(σ, T) للنقاط غير المخزنة فقط"""
+        if self.cache is None:
+            return compute(sigmas, Ts)
+        values, missing = self.cache.lookup(backend, self.precision, sigmas, Ts)
+        if missing.any():
+            fresh = compute(sigmas[missing], Ts[missing])
+            values[missing] = fresh
+            self.cache.store(backend, self.precision, sigmas[missing], Ts[missing], fresh)
+        return values
+    
+    def cache_info(self) -> Optional[Dict]:
+        """عدادات الذاكرة المؤقتة (None إن كانت معطلة)"""
+        return None if self.cache is None else self.cache.info()
+    
+    def temporal_zeta(self, sigma: float, T: float, max_tau: float = 50.0,
+                      method: str = 'discrete') -> complex:
+        """حساب دالة زيتا الزمنية
+        
+        method='discrete' يحسب المجموع الأولي مباشرة (ميكروثوانٍ)،
+        و method='quad' يحتفظ بالتكامل العددي القديم للمقارنة فقط.
+        """
+        if method == 'discrete':
+            if self.cache is not None or self.precision != 'float64':
+                return complex(self.evaluate_grid(sigma, T, max_tau))
+            return self.prime_sum(sigma, T, max_tau)
+        if method != 'quad':
+            raise ValueError(f"طريقة غير معروفة: {method!r} (discrete أو quad)")
+        
         def integrand(tau):
             psi_tau = self.time_density_function(tau)
             return psi_tau * np.exp(-sigma * tau) * np.exp(-1j * T * tau)
         
         # التكامل العددي
+        from scipy import integrate
+        self.evaluations += 1
         result, _ = integrate.quad(
             lambda tau: integrand(tau).real, 0, max_tau,
             limit=1000, epsabs=1e-12
@@ -106,155 +365,720 @@ class TemporalZetaFunction:
         
         return complex(result, imag_result)
     
+    def hardy_z(self, T):
+        """دالة هاردي Z(T) الحقيقية على الخط الحرج (ريمان-سيغل)"""
+        self.evaluations += np.size(T)
+        if self.cache is None:
+            return self.backend.hardy_z(T)
+        T_arr = np.asarray(T, dtype=np.float64)
+        flat = T_arr.ravel()
+        values = self._cached('riemann_siegel', np.full(flat.shape, 0.5), flat,
+                              lambda sig, t: self.backend.hardy_z(t))
+        Z = values.real.reshape(T_arr.shape)
+        return Z if Z.ndim else float(Z)
+    
     def classical_zeta_comparison(self, s: complex) -> complex:
         """مقارنة مع دالة زيتا الكلاسيكية"""
-        try:
+        s = complex(s)
+        if s.imag == 0:
+            from scipy.special import zeta
             return complex(zeta(s.real, 1))
-        except:
-            # حساب يدوي للقيم المعقدة
-            result = 0.0
-            for n in range(1, 1000):
-                result += 1.0 / (n ** s)
-            return result
+        
+        # على الخط الحرج: ζ(1/2 + it) = Z(t)·e^(-iθ(t)) بتكلفة O(√t)
+        t = abs(s.imag)
+        if s.real == 0.5 and t >= 2 * np.pi:
+            value = complex(riemann_siegel.zeta_critical_line(t))
+            return value if s.imag > 0 else value.conjugate()
+        
+        # بقية المستوى المركب: الحساب عالي الدقة عبر mpmath
+        import mpmath
+        return complex(mpmath.zeta(s))
 
 class RiemannZeroFinder:
     """باحث أصفار ريمان - Riemann Zero Finder"""
     
-    def __init__(self, zeta_func: TemporalZetaFunction):
+    def __init__(self, zeta_func: TemporalZetaFunction,
+                 known_zeros: Optional[str] = None, max_tau: float = 50.0):
         self.zeta = zeta_func
-        self.known_zeros = [
-            14.134725142,  # أول صفر غير تافه
-            21.022039639,
-            25.010857580,
-            30.424876126,
-            32.935061588
-        ]
+        # حد التكامل الزمني لمعيار الطاقة (الأعداد الأولية حتى e^max_tau)
+        self.max_tau = max_tau
+        # محرك التقييم المتعدد للعينات الكثيفة من Z(t)
+        self.multi_evaluator = OdlyzkoSchonhage()
+        # إحصاءات آخر بحث: عدد التقييمات والتقسيمات الإضافية
+        self.search_stats = self._empty_stats()
+        self.interval_profile: List[Dict] = []
+        # تصفير ذروة RSS للعملية عند قياس كل فترة (انظر Instrumentation)
+        self.reset_peak = False
+        # جدول الأصفار المرجعي: ملف ثنائي من known_zeros.py أو الأصفار الخمسة الأولى
+        if known_zeros is not None:
+            self.reference = KnownZeros.open(known_zeros)
+        else:
+            self.reference = KnownZeros.from_values(FIRST_KNOWN_ZEROS)
+        self.known_zeros = self.reference.values
     
     def energy_balance_condition(self, T: float) -> float:
         """شرط التوازن الطاقي عند σ = 0.5"""
         sigma = 0.5
-        zeta_val = self.zeta.temporal_zeta(sigma, T)
+        zeta_val = self.zeta.temporal_zeta(sigma, T, self.max_tau)
         return abs(zeta_val)
     
+    def hardy_condition(self, T: float) -> float:
+        """دالة هاردي Z(T): حقيقية وتغير إشارتها عند كل صفر على الخط الحرج"""
+        return self.zeta.hardy_z(T)
+    
+    def _scan_values(self, T_values: np.ndarray, criterion: str) -> np.ndarray:
+        """تقييم معيار البحث على مصفوفة من قيم T"""
+        if criterion == 'energy':
+            return np.abs(self.zeta.evaluate_grid(0.5, T_values, self.max_tau))
+        if criterion == 'hardy':
+            return np.asarray(self.zeta.hardy_z(T_values))
+        raise ValueError(f"معيار غير معروف: {criterion!r} (energy أو hardy)")
+    
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {'evaluations': 0, 'refinements': 0, 'brackets': 0, 'escalated': 0}
+    
     def find_critical_zeros(self, T_range: Tuple[float, float], 
-                          num_points: int = 1000) -> List[float]:
-        """البحث عن الأصفار الحرجة"""
-        T_values = np.linspace(T_range[0], T_range[1], num_points)
-        zeros = []
-        
-        for i in range(len(T_values) - 1):
-            T1, T2 = T_values[i], T_values[i + 1]
-            val1 = self.energy_balance_condition(T1)
-            val2 = self.energy_balance_condition(T2)
+                          num_points: int = 1000,
+                          criterion: str = 'energy',
+                          method: str = 'direct',
+                          scan: str = 'uniform',
+                          scan_density: float = 4.0,
+                          workers: Optional[int] = None,
+                          shards: Optional[int] = None,
+                          checkpoint: Optional[str] = None,
+                          resume: bool = False,
+                          checkpoint_interval: float = 5.0,
+                          sink: Union[ZeroSink, str, None] = None) -> Union[List[float], int]:
+        """البحث عن الأصفار الحرجة (الإحصاءات في search_stats)
+        
+        criterion: 'energy' (|ζ_temporal(0.5, T)|) أو 'hardy' (تغير إشارة Z).
+        method: 'direct' أو 'odlyzko_schonhage' (نافذة استيفاء، مع hardy فقط).
+        scan: 'uniform' (num_points نقطة) أو 'adaptive' (انظر _adaptive_scan).
+        workers، shards: فترات متداخلة في ProcessPoolExecutor (افتراضياً 4 لكل عملية).
+        checkpoint، resume: سجل الفترات المكتملة كل checkpoint_interval ثانية.
+        sink: None يعيد قائمة؛ ZeroSink أو مسار ملف يستقبلها ويُعاد عددها.
+        """
+        if sink is None:
+            target = ListSink()
+        elif isinstance(sink, str):
+            target = open_sink(sink)
+        else:
+            target = sink
+        try:
+            for batch in self._zero_batches(T_range, num_points, criterion, method,
+                                            scan, scan_density, workers, shards,
+                                            checkpoint, resume, checkpoint_interval):
+                target.write(batch)
+        finally:
+            if isinstance(sink, str):
+                target.close()
+            else:
+                target.flush()
+        return target.zeros if sink is None else target.count
+    
+    def iter_critical_zeros(self, T_range: Tuple[float, float], *args, **kwargs) -> Iterator[float]:
+        """مولّد الأصفار بالترتيب (نفس وسائط find_critical_zeros عدا sink)
+        
+        لا تُحفظ إلا فترة فرعية واحدة في الذاكرة في كل لحظة.
+        """
+        for batch in self._zero_batches(T_range, *args, **kwargs):
+            yield from batch.tolist()
+    
+    def _zero_batches(self, T_range: Tuple[float, float],
+                      num_points: int = 1000,
+                      criterion: str = 'energy',
+                      method: str = 'direct',
+                      scan: str = 'uniform',
+                      scan_density: float = 4.0,
+                      workers: Optional[int] = None,
+                      shards: Optional[int] = None,
+                      checkpoint: Optional[str] = None,
+                      resume: bool = False,
+                      checkpoint_interval: float = 5.0) -> Iterator[np.ndarray]:
+        """أصفار الفترات الفرعية بالترتيب، بعد حذف المكرر عند الحواف"""
+        parallel = workers is not None and workers > 1
+        self.search_stats = self._empty_stats()
+        self.interval_profile = []
+        scan_options = (scan, scan_density)
+        
+        if shards is None:
+            if parallel:
+                shards = 4 * workers
+            elif checkpoint is not None:
+                # فترة لكل ~1000 نقطة تكفي لنقاط حفظ متقاربة في البحث المتسلسل
+                shards = max(1, num_points // 1000)
+            else:
+                # البحث المتسلسل يُقطّع فقط حين تتجاوز الشبكة حجم الفترة
+                shards = max(1, num_points // SHARD_POINTS)
+        if shards == 1 and checkpoint is None:
+            zeros, record = self._profiled_search(0, (T_range, num_points, criterion,
+                                                      method) + scan_options)
+            self.interval_profile.append(record)
+            yield np.asarray(zeros)
+            return
+        
+        intervals = self._shard_intervals(T_range, num_points, shards)
+        tasks = [(bounds, points, criterion, method) + scan_options
+                 + ((T_range, num_points, start),)
+                 for bounds, points, start in intervals]
+        
+        ckpt = None
+        completed = {}
+        if checkpoint is not None:
+            config = {
+                'T_range': list(T_range), 'num_points': num_points,
+                'criterion': criterion, 'method': method, 'shards': shards,
+                'scan': scan, 'scan_density': scan_density,
+                'num_primes': len(self.zeta.ns.primes),
+                # الخلفية العددية بدقتها (auto يشارك float64 اسمه، فيُميز بالتصعيد)
+                'precision': self.zeta.precision_mode, 'backend': self.zeta.precision,
+                'escalation': getattr(self.zeta.backend.escalation, 'name', None),
+                'max_tau': self.max_tau,
+                # الفترات شرائح من شبكة T_range الواحدة (لا شبكة مستقلة لكل فترة)
+                'shard_grid': 'global'
+            }
+            ckpt = SearchCheckpoint(checkpoint, config, resume, checkpoint_interval)
+            completed = ckpt.completed
+        
+        step = (T_range[1] - T_range[0]) / max(num_points - 1, 1)
+        tol = 1e-3 * step
+        last = -np.inf
+        pending = [i for i in range(len(tasks)) if i not in completed]
+        executor = None
+        try:
+            if parallel:
+                executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                               initargs=(self,))
+                # map يحافظ على ترتيب الفترات، فيكفي الدمج المتسلسل
+                outputs = executor.map(_search_shard, [(i, tasks[i]) for i in pending])
+            for i in range(len(tasks)):
+                if i in completed:
+                    zeros = completed.pop(i)
+                else:
+                    if parallel:
+                        zeros, stats, record = next(outputs)
+                        for key, value in stats.items():
+                            self.search_stats[key] += value
+                        self.zeta.evaluations += record['evaluations']
+                    else:
+                        zeros, record = self._profiled_search(i, tasks[i])
+                    self.interval_profile.append(record)
+                    if ckpt:
+                        ckpt.record(i, zeros)
+                batch = _dedup_zeros(np.asarray(zeros, dtype=np.float64), last, tol)
+                if len(batch):
+                    last = batch[-1]
+                yield batch
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            if ckpt:
+                ckpt.close()
+    
+    def _shard_intervals(self, T_range: Tuple[float, float], num_points: int,
+                         shards: int) -> List[Tuple[Tuple[float, float], int, int]]:
+        """تقسيم شبكة T_range الواحدة إلى شرائح (الحدود، عدد النقاط، فهرس البداية)
+        
+        الشرائح المتجاورة تشترك في نقطة واحدة، فكل زوج نقاط متجاورة من
+        الشبكة في شريحة واحدة تماماً والنتيجة لا تتغير بعدد الفترات.
+        """
+        if num_points < 2:
+            return [(tuple(T_range), num_points, 0)]
+        edges = np.unique(np.linspace(0, num_points - 1, shards + 1).round().astype(np.int64))
+        intervals = []
+        for start, stop in zip(edges[:-1], edges[1:]):
+            ends = self._grid_points(T_range, num_points, start, 1)[0], \
+                   self._grid_points(T_range, num_points, stop, 1)[0]
+            intervals.append(((float(ends[0]), float(ends[1])), int(stop - start + 1), int(start)))
+        return intervals
+    
+    @staticmethod
+    def _grid_points(T_range: Tuple[float, float], num_points: int,
+                     start: int, count: int) -> np.ndarray:
+        """النقاط start..start+count-1 من np.linspace(*T_range, num_points) بنفس قيمها
+        دون بناء الشبكة كلها"""
+        T1, T2 = T_range
+        step = (T2 - T1) / max(num_points - 1, 1)
+        T_values = np.arange(start, start + count, dtype=np.float64) * step + T1
+        if num_points > 1 and start + count == num_points:
+            T_values[-1] = T2  # linspace يضع نهاية المجال تماماً
+        return T_values
+    
+    def _profiled_search(self, index: int, task: Tuple) -> Tuple[List[float], Dict]:
+        """_search_interval مع قياس الفترة (زمن، معالج، ذاكرة، تقييمات)"""
+        measurement = Measurement(lambda: self.zeta.evaluations, self.reset_peak)
+        zeros = self._search_interval(*task)
+        return zeros, measurement.finish(interval=index, T_range=list(task[0]),
+                                         zeros=len(zeros))
+    
+    def _search_interval(self, T_range: Tuple[float, float], num_points: int,
+                         criterion: str, method: str, scan: str = 'uniform',
+                         scan_density: float = 4.0,
+                         grid: Optional[Tuple[Tuple[float, float], int, int]] = None) -> List[float]:
+        """البحث المتسلسل في فترة واحدة
+        
+        grid: (المجال الكامل، عدد نقاطه، فهرس البداية) لشريحة من شبكة أكبر.
+        مع خلفية precision='auto' تُعاد العينات الملتبسة بـ mpmath (escalated).
+        """
+        if method == 'odlyzko_schonhage':
+            if criterion != 'hardy':
+                raise ValueError("طريقة odlyzko_schonhage تتطلب criterion='hardy'")
+            window = self.multi_evaluator.window(T_range[0], T_range[1])
+            # عينات Z المنتظمة التي تُبنى منها النافذة تقييمات أيضاً
+            self.zeta.evaluations += window.evaluations
             
-            # البحث عن تغيير الإشارة
-            if val1 * val2 < 0:
-                try:
-                    zero = optimize.brentq(
-                        self.energy_balance_condition, T1, T2,
-                        xtol=1e-12, maxiter=1000
-                    )
+            def evaluate(T):
+                self.zeta.evaluations += np.size(T)
+                return window(T)
+        elif method == 'direct':
+            # تقييم الشبكة كاملة باستدعاء واحد بدلاً من نقطتين لكل فترة
+            evaluate = lambda T: self._scan_values(T, criterion)
+        else:
+            raise ValueError(f"طريقة غير معروفة: {method!r} (direct أو odlyzko_schonhage)")
+        
+        if scan == 'uniform':
+            if grid is None:
+                T_values = np.linspace(T_range[0], T_range[1], num_points)
+            else:
+                T_values = self._grid_points(grid[0], grid[1], grid[2], num_points)
+            values = evaluate(T_values)
+        elif scan == 'adaptive':
+            T_values, values = self._adaptive_scan(T_range, evaluate, scan_density,
+                                                   subdivide=criterion == 'hardy')
+        else:
+            raise ValueError(f"نمط مسح غير معروف: {scan!r} (uniform أو adaptive)")
+        self.search_stats['evaluations'] += len(T_values)
+        
+        # precision='auto': إعادة تقييم العينات التي تقع ضمن خطأ float64 المقدر
+        # لـ Z بالخلفية الأدق، فإشارتها (ووجود تغير الإشارة حولها) غير مؤكدة
+        escalation = self.zeta.backend.escalation
+        escalated = np.zeros(len(T_values), dtype=bool)
+        if escalation is not None and criterion == 'hardy':
+            escalated = np.abs(values) < 10 * riemann_siegel.hardy_z_error(T_values)
+            if escalated.any():
+                values = np.array(values, dtype=np.float64)
+                values[escalated] = escalation.hardy_z(T_values[escalated])
+                self.zeta.evaluations += int(escalated.sum())
+                self.search_stats['escalated'] += int(escalated.sum())
+        
+        # البحث عن تغيير الإشارة
+        brackets = np.flatnonzero(values[:-1] * values[1:] < 0)
+        self.search_stats['brackets'] += len(brackets)
+        precise = escalated[brackets] | escalated[brackets + 1]
+        fast = brackets[~precise]
+        zeros, calls = self._refine_brackets(T_values[fast], T_values[fast + 1],
+                                             evaluate, values[fast], values[fast + 1])
+        self.search_stats['evaluations'] += calls
+        
+        if precise.any():
+            # الفترات الملتبسة تُنقّح كلها بالخلفية الأدق
+            before = escalation.evaluations
+            for i in brackets[precise]:
+                zero = escalation.find_root(T_values[i], T_values[i + 1])
+                if zero is not None:
                     zeros.append(zero)
-                except:
-                    continue
-                    
+            calls = escalation.evaluations - before
+            self.zeta.evaluations += calls
+            self.search_stats['evaluations'] += calls
+            zeros.sort()
         return zeros
     
-    def verify_riemann_hypothesis(self, zeros: List[float]) -> Dict:
-        """التحقق من فرضية ريمان"""
+    def _adaptive_scan(self, T_range: Tuple[float, float], evaluate,
+                       density: float, subdivide: bool = True,
+                       max_depth: int = 6) -> Tuple[np.ndarray, np.ndarray]:
+        """مسح بخطوة تتبع كثافة الأصفار المتوقعة
+        
+        النقاط متساوية في θ(T)/π (نقاط غرام كسرية)، أي خطوة محلية تساوي
+        متوسط المسافة 2π/ln(T/2π) مقسوماً على density. subdivide يقسم ما
+        حول كل قاع لـ |Z| بلا تغير إشارة بحثاً عن زوج أصفار متقاربين.
+        """
+        T1, T2 = T_range
+        # θ متزايدة بعد قاعها عند t ≈ 6.29 (θ/π ≈ -1.125)
+        u1 = max(riemann_siegel.theta(max(T1, 6.3)) / np.pi, -1.12)
+        u2 = riemann_siegel.theta(T2) / np.pi
+        u = np.arange(np.ceil(u1 * density), np.floor(u2 * density) + 1) / density
+        T_values = np.unique(np.concatenate(([T1], riemann_siegel.gram_point(u), [T2])))
+        T_values = T_values[(T_values >= T1) & (T_values <= T2)]
+        values = np.asarray(evaluate(T_values))
+        
+        for _ in range(max_depth if subdivide else 0):
+            # قاع لـ |Z| بين جارين من نفس الإشارة: احتمال زوج أصفار متقاربين
+            same = (values[:-2] * values[1:-1] > 0) & (values[1:-1] * values[2:] > 0)
+            dip = (np.abs(values[1:-1]) < np.abs(values[:-2])) & \
+                  (np.abs(values[1:-1]) < np.abs(values[2:]))
+            centers = np.flatnonzero(same & dip) + 1
+            if len(centers) == 0:
+                break
+            self.search_stats['refinements'] += len(centers)
+            
+            mids = np.concatenate(((T_values[centers - 1] + T_values[centers]) / 2,
+                                   (T_values[centers] + T_values[centers + 1]) / 2))
+            mids = np.unique(mids)
+            # لا تُعد هنا: T_values المعادة تضمها وتُعد كلها في _search_interval
+            mid_values = np.asarray(evaluate(mids))
+            
+            order = np.argsort(np.concatenate((T_values, mids)), kind='mergesort')
+            T_values = np.concatenate((T_values, mids))[order]
+            values = np.concatenate((values, mid_values))[order]
+        
+        return T_values, values
+    
+    def _refine_brackets(self, lows: np.ndarray, highs: np.ndarray, evaluate,
+                         f_lows: Optional[np.ndarray] = None,
+                         f_highs: Optional[np.ndarray] = None,
+                         xtol: float = 1e-12,
+                         maxiter: int = 100) -> Tuple[List[float], int]:
+        """تنقيح كل فترات تغير الإشارة معاً بطريقة إلينوي المتجهة
+        
+        evaluate دالة متجهة (شبكة)، فكل تكرار يقيّم نقطة واحدة لكل فترة
+        نشطة باستدعاء واحد، وتخرج الفترات المتقاربة من المجموعة النشطة.
+        f_lows و f_highs قيم الأطراف إن كانت معروفة من المسح.
+        يعيد الأصفار بترتيب الفترات وعدد التقييمات.
+        """
+        a = np.asarray(lows, dtype=np.float64).copy()
+        b = np.asarray(highs, dtype=np.float64).copy()
+        calls = 0
+        if a.size == 0:
+            return [], calls
+        if f_lows is None or f_highs is None:
+            f_both = np.asarray(evaluate(np.concatenate((a, b))), dtype=np.float64)
+            calls += 2 * a.size
+            f_lows, f_highs = f_both[:a.size], f_both[a.size:]
+        fa = np.asarray(f_lows, dtype=np.float64).copy()
+        fb = np.asarray(f_highs, dtype=np.float64).copy()
+        
+        roots = np.full(a.size, np.nan)
+        roots[fa == 0] = a[fa == 0]
+        roots[fb == 0] = b[fb == 0]
+        active = np.flatnonzero((fa * fb < 0) & np.isnan(roots))
+        
+        for _ in range(maxiter):
+            if active.size == 0:
+                break
+            aa, bb, fra, frb = a[active], b[active], fa[active], fb[active]
+            c = (aa * frb - bb * fra) / (frb - fra)
+            fc = np.asarray(evaluate(c), dtype=np.float64)
+            calls += active.size
+            
+            # [a, b] تبقى فترة تغير إشارة: b آخر تقدير، و a الطرف المقابل
+            flip = fc * frb < 0
+            aa = np.where(flip, bb, aa)
+            fra = np.where(flip, frb, fra / 2)  # تعديل إلينوي للطرف الثابت
+            a[active], fa[active] = aa, fra
+            b[active], fb[active] = c, fc
+            
+            done = (fc == 0) | (np.abs(c - aa) <= xtol + 4 * np.finfo(float).eps * np.abs(c))
+            roots[active[done]] = c[done]
+            active = active[~done & np.isfinite(fc)]
+        
+        # فترات لم تتقارب خلال maxiter: أفضل تقدير متاح
+        roots[active] = b[active]
+        return [float(r) for r in roots if np.isfinite(r)], calls
+    
+    def isolate_zeros_gram(self, T_range: Tuple[float, float],
+                           max_depth: int = 12) -> Dict:
+        """عزل كل الأصفار في T_range بنقاط غرام وكتل روسر مع عدّ تورنغ
+        
+        تُقيَّم Z عند نقاط غرام فقط (نقطة لكل صفر تقريباً)، وتُقسَّم كتلة روسر
+        التي تحوي تغيرات إشارة أقل من طولها حتى max_depth مرة. طريقة تورنغ
+        (صيغة برنت): K كتلة تحقق قاعدة روسر بعد g_b وقبل g_a حيث
+        K ≥ 0.0061·ln²(g) + 0.08·ln(g) و g نقطة غرام الخارجية لكتل تورنغ
+        تثبت أن عدد الأصفار في (g_a, g_b] لا يتجاوز b - a، فإن عُزل هذا
+        العدد كانت القائمة كاملة.
+        """
+        T1, T2 = T_range
+        # تقدير أولي من T2، ويُرفع أدناه حتى يكفي لنقطة غرام الخارجية الفعلية
+        K = riemann_siegel.turing_block_count(max(T2, 2 * np.pi))
+        
+        # فهارس غرام التي تغطي T_range مع هامش لكتل تورنغ على الطرفين
+        n_lo = int(np.floor(riemann_siegel.theta(max(T1, 10.0)) / np.pi))
+        n_hi = int(np.ceil(riemann_siegel.theta(T2) / np.pi))
+        margin = 4 * K + 8
+        evaluations = 0
+        while True:
+            n = np.arange(max(-1, n_lo - margin), n_hi + margin + 1)
+            g = riemann_siegel.gram_point(n)
+            Z = np.asarray(self.zeta.hardy_z(g))
+            evaluations += len(n)
+            good = np.flatnonzero((-1.0) ** n * Z > 0)
+            
+            # نقاط غرام الجيدة المحيطة بالمجال: g_a ≤ T1 و g_b ≥ T2
+            before = good[g[good] <= T1]
+            after = good[g[good] >= T2]
+            # عند بداية متسلسلة غرام نستخدم N(g_-1) = 0 (أول صفر عند 14.13)
+            # بدلاً من كتل تورنغ السفلية
+            at_origin = n[0] == -1 and len(before) <= K
+            if (len(before) > K or at_origin) and len(after) > K:
+                # g الخارجية أعلى من T2: الكتل الأبعد قد تتطلب K أكبر
+                required = riemann_siegel.turing_block_count(g[after[K]])
+                if required <= K:
+                    break
+                K = required
+                continue
+            margin *= 2
+        
+        if at_origin:
+            a_pos = start = 0  # g_-1 جيدة لأن Z < 0 على [2π, 14.13)
+        else:
+            a_pos, start = before[-1], before[-1 - K]
+        b_pos, stop = after[0], after[K]
+        
+        blocks = []
+        violations = []
+        lows, highs, f_lows, f_highs = [], [], [], []
+        block_starts = good[(good >= start) & (good <= stop)]
+        for left, right in zip(block_starts[:-1], block_starts[1:]):
+            length = right - left
+            ts = g[left:right + 1]
+            vals = Z[left:right + 1]
+            changes = np.flatnonzero(vals[:-1] * vals[1:] < 0)
+            depth = 0
+            # قاعدة روسر: الكتلة بطول k تحوي k صفراً على الأقل
+            while len(changes) < length and depth < max_depth:
+                mids = (ts[:-1] + ts[1:]) / 2
+                mid_vals = np.asarray(self.zeta.hardy_z(mids))
+                evaluations += len(mids)
+                ts = np.insert(ts, np.arange(1, len(ts)), mids)
+                vals = np.insert(vals, np.arange(1, len(vals)), mid_vals)
+                changes = np.flatnonzero(vals[:-1] * vals[1:] < 0)
+                depth += 1
+            
+            block = {'gram_start': int(n[left]), 'length': int(length),
+                     'sign_changes': int(len(changes))}
+            blocks.append(block)
+            if len(changes) < length:
+                violations.append(block)
+            if left >= a_pos and right <= b_pos:
+                lows.extend(ts[changes])
+                highs.extend(ts[changes + 1])
+                f_lows.extend(vals[changes])
+                f_highs.extend(vals[changes + 1])
+        
+        lows, highs = np.array(lows), np.array(highs)
+        all_zeros, calls = self._refine_brackets(lows, highs, self.zeta.hardy_z,
+                                                 np.array(f_lows), np.array(f_highs))
+        all_zeros = np.array(all_zeros)
+        evaluations += calls
+        expected = int(n[b_pos] - n[a_pos])
+        
+        # كتل تورنغ خارج [g_a, g_b] يجب أن تحقق قاعدة روسر كلها
+        turing_violations = [b for b in violations
+                             if b['gram_start'] >= n[b_pos] or b['gram_start'] < n[a_pos]]
+        turing_verified = not turing_violations
+        
+        zeros = all_zeros[(all_zeros >= T1) & (all_zeros <= T2)]
+        # فترة تغير الإشارة لكل صفر (الفترات مرتبة ومنفصلة)
+        which = np.searchsorted(lows, zeros, side='right') - 1
+        return {
+            'T_range': (T1, T2),
+            'gram_range': (float(g[a_pos]), float(g[b_pos])),
+            'gram_indices': (int(n[a_pos]), int(n[b_pos])),
+            'expected_zeros': expected,
+            'isolated_zeros': int(len(all_zeros)),
+            'rosser_blocks': len(blocks),
+            'rosser_violations': violations,
+            'turing_blocks_required': K,
+            'turing_gram_point': float(g[stop]),
+            'turing_verified': bool(turing_verified),
+            'complete': bool(turing_verified and len(all_zeros) == expected),
+            'evaluations': evaluations,
+            'zeros': zeros.tolist(),
+            'brackets': np.column_stack((lows[which], highs[which])).tolist()
+        }
+    
+    def verify_riemann_hypothesis(self, zeros: List[float],
+                                  criterion: str = 'energy',
+                                  mode: str = 'value',
+                                  T_range: Optional[Tuple[float, float]] = None,
+                                  certify: bool = False,
+                                  workers: Optional[int] = None,
+                                  certification_file: Optional[str] = None) -> Dict:
+        """التحقق من فرضية ريمان (zeros_on_critical_line قناع موازٍ لـ zeros)
+        
+        mode: 'value' أو 'gram' (فحص الاكتمال، انظر isolate_zeros_gram).
+        certify: إثبات تغير الإشارة بحساب الفترات على workers عملية (certified_zeros)؛
+        certification_file يكتب سجلات الإثبات فيه (JSON Lines) بدلاً من قائمة.
+        """
         results = {
             'total_zeros': len(zeros),
             'verified_zeros': 0,
             'accuracy': 0.0,
             'max_deviation': 0.0,
-            'zeros_on_critical_line': []
+            'zeros_on_critical_line': np.zeros(len(zeros), dtype=bool)
         }
         
-        for T in zeros:
-            # التحقق من أن الصفر على الخط الحرج σ = 0.5
-            zeta_val = self.zeta.temporal_zeta(0.5, T)
-            deviation = abs(zeta_val)
-            
-            if deviation < 1e-6:  # دقة مقبولة
-                results['verified_zeros'] += 1
-                results['zeros_on_critical_line'].append(T)
-            
-            results['max_deviation'] = max(results['max_deviation'], deviation)
+        # التحقق من أن الأصفار على الخط الحرج σ = 0.5 (تقييم دفعي لكل كتلة)
+        on_line = results['zeros_on_critical_line']
+        for start in range(0, len(zeros), SHARD_POINTS):
+            batch = np.asarray(zeros[start:start + SHARD_POINTS], dtype=np.float64)
+            deviations = np.abs(self._scan_values(batch, criterion))
+            on_line[start:start + len(batch)] = deviations < 1e-6  # دقة مقبولة
+            results['max_deviation'] = max(results['max_deviation'], float(deviations.max()))
+        results['verified_zeros'] = int(on_line.sum())
         
         if results['total_zeros'] > 0:
             results['accuracy'] = results['verified_zeros'] / results['total_zeros']
         
+        if mode == 'gram':
+            if T_range is None:
+                if len(zeros) == 0:
+                    raise ValueError("mode='gram' بلا أصفار معطاة يتطلب T_range")
+                T_range = (float(np.min(zeros)), float(np.max(zeros)))
+            completeness = self.isolate_zeros_gram(T_range)
+            isolated = np.asarray(completeness.pop('zeros'))
+            brackets = np.asarray(completeness.pop('brackets')).reshape(-1, 2)
+            
+            # الصفر المعزول مطابَق إن وقع صفر معطى في فترة تغير إشارته نفسها
+            # (لا بتسامح ثابت: خطأ Z يزيح الأصفار أكثر من 1e-6 عند T صغيرة)
+            given = np.sort(np.asarray(zeros, dtype=np.float64))
+            inside = (np.searchsorted(given, brackets[:, 1], side='right') >
+                      np.searchsorted(given, brackets[:, 0], side='left'))
+            completeness['missed_zeros'] = isolated[~inside].tolist()
+            results['completeness'] = completeness
+        elif mode != 'value':
+            raise ValueError(f"نمط تحقق غير معروف: {mode!r} (value أو gram)")
+        
+        if certify:
+            results['certification'] = certify_zeros(zeros, workers=workers,
+                                                     records_file=certification_file)
+        
         return results
 
+# العمليات الفرعية للبحث المتوازي: باحث واحد لكل عملية يُنشأ مرة واحدة
+_worker_finder: Optional[RiemannZeroFinder] = None
+
+def _init_worker(finder: RiemannZeroFinder):
+    """تهيئة العملية الفرعية بنسخة من الباحث"""
+    global _worker_finder
+    _worker_finder = finder
+
+def _search_shard(indexed_task) -> Tuple[List[float], Dict, Dict]:
+    """البحث في فترة واحدة داخل عملية فرعية؛ يعيد الأصفار والإحصاءات والقياس"""
+    index, task = indexed_task
+    _worker_finder.search_stats = _worker_finder._empty_stats()
+    zeros, record = _worker_finder._profiled_search(index, task)
+    return zeros, _worker_finder.search_stats, record
+
+def _dedup_zeros(zeros: np.ndarray, last: float, tol: float) -> np.ndarray:
+    """حذف أصفار فترة مرتبة تكرر ما سبقها (ضمن tol) عند الحواف المتداخلة"""
+    keep = np.diff(zeros, prepend=last) > tol
+    return zeros[keep]
+
 class TemporalRiemannSolver:
     """حلال ريمان الزمني الشامل - Comprehensive Temporal Riemann Solver"""
     
-    def __init__(self):
-        self.number_system = TemporalNumberSystem()
-        self.zeta_function = TemporalZetaFunction(self.number_system)
-        self.zero_finder = RiemannZeroFinder(self.zeta_function)
+    def __init__(self, cache_size: int = 0, cache_path: Optional[str] = None,
+                 prime_limit: int = 10000, prime_table: Optional[str] = None,
+                 precision: str = 'float64', dps: int = 30,
+                 known_zeros: Optional[str] = None):
+        self.number_system = TemporalNumberSystem(prime_limit, prime_table)
+        self.zeta_function = TemporalZetaFunction(self.number_system,
+                                                  cache_size=cache_size,
+                                                  cache_path=cache_path,
+                                                  precision=precision,
+                                                  dps=dps)
+        self.zero_finder = RiemannZeroFinder(self.zeta_function, known_zeros)
+        
+    def run_complete_analysis(self, T_range: Tuple[float, float] = (10.0, 50.0),
+                              num_points: int = 2000,
+                              criterion: str = 'energy',
+                              method: str = 'direct',
+                              scan: str = 'uniform',
+                              workers: Optional[int] = None,
+                              checkpoint: Optional[str] = None,
+                              resume: bool = False,
+                              precision: Optional[str] = None,
+                              dps: int = 30,
+                              certify: bool = False,
+                              zeros_file: Optional[str] = None,
+                              profile: Optional[str] = None,
+                              trace: Optional[str] = None,
+                              reset_peak: bool = False) -> Dict:
+        """تشغيل التحليل الكامل
         
-    def run_complete_analysis(self) -> Dict:
-        """تشغيل التحليل الكامل"""
+        precision (float64 أو mpmath أو auto) يغيّر الخلفية العددية لهذا
+        التشغيل وما بعده؛ None يبقي الخلفية الحالية.
+        zeros_file يكتب الأصفار تدريجياً في ملف (.jsonl أو float64 ثنائي)
+        بدلاً من قائمة، ثم تُقرأ منه (الثنائي بـ memmap) لبقية التحليل؛ سجلات
+        certify تُكتب حينها في <zeros_file>.certification.jsonl.
+        results['profile'] يسجل لكل مرحلة ولكل فترة بحث فرعية زمن الساعة
+        والمعالج وذروة RSS وعدد التقييمات؛ profile يكتب ملف pstats (cProfile)
+        و trace ملف Chrome trace JSON. ذروة RSS لعمر العملية ما لم يُطلب
+        reset_peak (ذروة كل مرحلة بتصفير ذروة العملية، انظر Instrumentation).
+        """
         print("🚀 بدء التحليل الزمني الشامل لمسألة ريمان...")
         start_time = time.time()
+        if precision is not None:
+            self.zeta_function.set_precision(precision, dps)
         
         results = {
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
             'theory_version': '2.0 Advanced Temporal',
+            'precision': self.zeta_function.precision_mode,
             'constants': {
                 't_p': self.number_system.t_p,
                 'beta': self.number_system.beta,
                 'T_universe': self.number_system.T_universe
             }
         }
+        evaluations = lambda: self.zeta_function.evaluations
         
-        # 1. البحث عن الأصفار
-        print("🔍 البحث عن الأصفار الحرجة...")
-        zeros = self.zero_finder.find_critical_zeros((10.0, 50.0), 2000)
-        
-        # 2. التحقق من فرضية ريمان
-        print("✅ التحقق من فرضية ريمان...")
-        verification = self.zero_finder.verify_riemann_hypothesis(zeros)
-        
-        # 3. مقارنة مع الأصفار المعروفة
-        print("📊 مقارنة مع الأصفار المعروفة...")
-        comparison = self._compare_with_known_zeros(zeros)
-        
-        # 4. تحليل التوازن الطاقي
-        print("⚖️ تحليل التوازن الطاقي...")
-        energy_analysis = self._analyze_energy_balance()
+        with Instrumentation(profile, trace, reset_peak) as instrumentation:
+            self.zero_finder.reset_peak = reset_peak
+            # 1. البحث عن الأصفار
+            print("🔍 البحث عن الأصفار الحرجة...")
+            with instrumentation.stage('zero_search', evaluations):
+                zeros = self.zero_finder.find_critical_zeros(T_range, num_points,
+                                                             criterion=criterion,
+                                                             method=method,
+                                                             scan=scan,
+                                                             workers=workers,
+                                                             checkpoint=checkpoint,
+                                                             resume=resume,
+                                                             sink=zeros_file)
+                if zeros_file is not None:
+                    zeros = load_zeros(zeros_file)
+                    results['zeros_file'] = zeros_file
+            
+            # 2. التحقق من فرضية ريمان
+            print("✅ التحقق من فرضية ريمان...")
+            with instrumentation.stage('verification', evaluations):
+                certification_file = None
+                if zeros_file is not None:
+                    certification_file = os.path.splitext(zeros_file)[0] + '.certification.jsonl'
+                verification = self.zero_finder.verify_riemann_hypothesis(
+                    zeros, criterion, certify=certify, workers=workers,
+                    certification_file=certification_file)
+            
+            # 3. مقارنة مع الأصفار المعروفة
+            print("📊 مقارنة مع الأصفار المعروفة...")
+            with instrumentation.stage('comparison', evaluations):
+                comparison = self._compare_with_known_zeros(zeros, T_range)
+            
+            # 4. تحليل التوازن الطاقي
+            print("⚖️ تحليل التوازن الطاقي...")
+            with instrumentation.stage('energy_analysis', evaluations):
+                energy_analysis = self._analyze_energy_balance()
         
         results.update({
             'found_zeros': zeros,
+            'search_stats': dict(self.zero_finder.search_stats),
             'verification': verification,
             'comparison': comparison,
             'energy_analysis': energy_analysis,
+            'profile': instrumentation.report(self.zero_finder.interval_profile),
             'execution_time': time.time() - start_time
         })
+        if self.zeta_function.cache is not None:
+            results['cache'] = self.zeta_function.cache_info()
         
         return results
     
-    def _compare_with_known_zeros(self, found_zeros: List[float]) -> Dict:
-        """مقارنة مع الأصفار المعروفة"""
-        known = self.zero_finder.known_zeros
-        matches = 0
-        total_error = 0.0
-        
-        for known_zero in known:
-            closest = min(found_zeros, key=lambda x: abs(x - known_zero))
-            error = abs(closest - known_zero)
-            total_error += error
-            
-            if error < 0.01:  # دقة 1%
-                matches += 1
-        
-        return {
-            'known_zeros': len(known),
-            'matches': matches,
-            'match_rate': matches / len(known) if known else 0,
-            'average_error': total_error / len(known) if known else 0
-        }
+    def _compare_with_known_zeros(self, found_zeros: List[float],
+                                  T_range: Optional[Tuple[float, float]] = None) -> Dict:
+        """مقارنة مع الأصفار المعروفة (ضمن T_range إن أعطي)"""
+        return compare_zeros(found_zeros, self.zero_finder.reference, T_range)
     
     def _analyze_energy_balance(self) -> Dict:
         """تحليل التوازن الطاقي"""
@@ -268,19 +1092,94 @@ class TemporalRiemannSolver:
         
         return analysis
     
-    def save_results(self, results: Dict, filename: str = 'riemann_temporal_results.json'):
-        """حفظ النتائج"""
+    def save_results(self, results: Dict, filename: str = 'riemann_temporal_results.json',
+                     format: Optional[str] = None):
+        """حفظ النتائج
+        
+        format='json' (الافتراضي) يكتب JSON منسقاً: الأصفار المكتوبة في
+        zeros_file تُحفظ كمرجع للملف وقناع التحقق كعدد فقط، وإلا يُحفظ القناع
+        كقائمة الأصفار المتحقق منها. format='npz' (أو امتداد .npz) يكتب حاوية
+        عمودية: المصفوفات أعمدة .npy وبقية النتائج بيان JSON (results_store).
+        """
+        if format is None:
+            format = 'npz' if filename.endswith('.npz') else 'json'
+        if format == 'npz':
+            save_columnar(results, filename)
+            print(f"💾 تم حفظ النتائج في: {filename}")
+            return
+        if format != 'json':
+            raise ValueError(f"صيغة غير معروفة: {format!r} (json أو npz)")
+        # مسارات الملفات المرجعية تُحفظ نسبةً إلى مجلد ملف النتائج
+        folder = os.path.dirname(os.path.abspath(filename))
+        relative = lambda path: os.path.relpath(os.path.abspath(path), folder)
+        zeros_file = results.get('zeros_file')
+        if zeros_file is not None:
+            results = dict(results, found_zeros={'file': relative(zeros_file),
+                                                 'count': len(results['found_zeros'])})
+        verification = results.get('verification')
+        if verification is not None and isinstance(
+                verification.get('zeros_on_critical_line'), np.ndarray):
+            mask = verification['zeros_on_critical_line']
+            if zeros_file is not None:
+                on_line = {'file': relative(zeros_file), 'count': int(mask.sum())}
+            else:
+                on_line = np.asarray(results['found_zeros'])[mask].tolist()
+            verification = dict(verification, zeros_on_critical_line=on_line)
+            certification = verification.get('certification')
+            if certification is not None and isinstance(certification['records'], dict):
+                records = dict(certification['records'],
+                               file=relative(certification['records']['file']))
+                verification['certification'] = dict(certification, records=records)
+            results = dict(results, verification=verification)
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
         print(f"💾 تم حفظ النتائج في: {filename}")
     
-    def visualize_results(self, results: Dict):
-        """تصور النتائج"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+    @staticmethod
+    def load_results(filename: str) -> Dict:
+        """تحميل نتائج محفوظة؛ أعمدة .npz تُربط بالذاكرة (memmap) دون قراءتها
+
+        مرجع found_zeros {'file', 'count'} في JSON يُقرأ بـ load_zeros (المسار
+        نسبةً إلى مجلد ملف النتائج)؛ بقية المراجع تبقى كما هي.
+        """
+        if filename.endswith('.npz'):
+            return load_columnar(filename)
+        with open(filename, 'r', encoding='utf-8') as f:
+            results = json.load(f)
+        reference = results.get('found_zeros')
+        if isinstance(reference, dict) and 'file' in reference:
+            folder = os.path.dirname(os.path.abspath(filename))
+            results['found_zeros'] = load_zeros(os.path.join(folder, reference['file']))
+        return results
+    
+    def visualize_results(self, results: Dict,
+                          filename: str = 'riemann_temporal_analysis.png',
+                          dpi: int = 300, format: Optional[str] = None,
+                          headless: bool = False,
+                          max_points: int = DECIMATE_POINTS) -> str:
+        """تصور النتائج
+        
+        headless=True يرسم بـ Agg مباشرة على Figure مستقل (دون pyplot ولا
+        show)، للعمليات بلا شاشة. السلاسل الأطول من max_points تُختزل بطريقة
+        min/max (أصغر وأكبر قيمة في كل دلو) فتبقى الحواف والفجوات مرئية،
+        والمدرج التكراري يُحسب بـ np.histogram دون نسخ الأصفار.
+        dpi و format (png، svg، pdf...) يمرران إلى savefig. يعيد مسار الملف.
+        """
+        if headless:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            fig = Figure(figsize=(15, 12))
+            FigureCanvasAgg(fig)
+            ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+        else:
+            import matplotlib.pyplot as plt
+            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
         
         # 1. الأصفار المكتشفة
-        zeros = results['found_zeros']
-        ax1.scatter(zeros, [0.5] * len(zeros), c='red', s=50, alpha=0.7)
+        zeros = np.asarray(results['found_zeros'], dtype=np.float64)
+        shown = zeros[_minmax_decimate(zeros, max_points)]
+        ax1.scatter(shown, np.full(len(shown), 0.5), c='red', s=50 if len(shown) < 1000 else 4,
+                    alpha=0.7, rasterized=len(shown) >= 1000)
         ax1.axhline(y=0.5, color='blue', linestyle='--', alpha=0.5)
         ax1.set_xlabel('T (الجزء التخيلي)')
         ax1.set_ylabel('σ (الجزء الحقيقي)')
@@ -296,8 +1195,9 @@ class TemporalRiemannSolver:
         ax2.set_title('دقة التحقق من فرضية ريمان')
         
         # 3. توزيع الأصفار
-        if zeros:
-            ax3.hist(zeros, bins=20, alpha=0.7, color='green')
+        if len(zeros):
+            counts, edges = np.histogram(zeros, bins=20)
+            ax3.hist(edges[:-1], edges, weights=counts, alpha=0.7, color='green')
             ax3.set_xlabel('قيم T')
             ax3.set_ylabel('التكرار')
             ax3.set_title('توزيع الأصفار الحرجة')
@@ -311,9 +1211,26 @@ class TemporalRiemannSolver:
         ax4.set_title('التوازن الطاقي عند σ = 0.5')
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig('riemann_temporal_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        fig.tight_layout()
+        fig.savefig(filename, dpi=dpi, format=format, bbox_inches='tight')
+        if not headless:
+            plt.show()
+        return filename
+
+def _minmax_decimate(y: np.ndarray, max_points: int) -> np.ndarray:
+    """فهارس اختزال min/max: أصغر وأكبر عنصر في كل دلو متساوٍ (مرتبة)"""
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    buckets = max(1, max_points // 2)
+    size = n // buckets
+    blocks = y[:buckets * size].reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    idx = np.concatenate([offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1)])
+    if buckets * size < n:
+        tail = y[buckets * size:]
+        idx = np.append(idx, [buckets * size + tail.argmin(), buckets * size + tail.argmax()])
+    return np.unique(idx)
 
 def main():
     """الدالة الرئيسية"""
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+نقاط الحفظ لعمليات البحث الطويلة عن الأصفار
+Checkpoints for long zero-search runs
+
+سجل إلحاقي (JSON Lines): السطر الأول يحمل بصمة الإعدادات، وكل سطر بعده
+فترة فرعية مكتملة مع أصفارها. كل دفعة تُكتب باستدعاء write واحد ثم fsync،
+والسطر الأخير المبتور بعد انهيار يُتجاهل عند الاستئناف، فتبقى الكتابة
+ذرية ورخيصة (تكلفتها تتناسب مع الجديد فقط وليس مع كل ما سبق).
+Append-only JSON Lines journal: a header with the config hash, then one
+record per completed sub-interval. Torn trailing lines are ignored on resume.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List
+
+
+def config_hash(config: Dict) -> str:
+    """بصمة SHA-256 لإعدادات البحث"""
+    canonical = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class SearchCheckpoint:
+    """سجل تقدم البحث - Zero-search progress journal"""
+
+    def __init__(self, path: str, config: Dict, resume: bool = False,
+                 interval: float = 5.0):
+        self.path = path
+        self.config_hash = config_hash(config)
+        # أقل فاصل زمني (بالثواني) بين عمليتي كتابة على القرص
+        self.interval = interval
+        self.completed: Dict[int, List[float]] = {}
+        self._pending: List[str] = []
+        self._last_flush = time.monotonic()
+
+        if resume and os.path.exists(path) and self._load():
+            self._file = open(path, 'a', encoding='utf-8')
+        else:
+            self._file = open(path, 'w', encoding='utf-8')
+            header = {'config_hash': self.config_hash, 'config': config}
+            self._write([json.dumps(header, default=str)])
+
+    def _load(self) -> bool:
+        """قراءة الفترات المكتملة من سجل سابق؛ يعيد False إن كان السجل فارغاً"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            lines = f.read().split('\n')
+
+        # العنصر الأخير هو ما بعد آخر سطر جديد: فارغ أو بقايا كتابة مبتورة
+        if len(lines) < 2:
+            return False  # انهيار أثناء كتابة الرأس: نبدأ من جديد
+        header = json.loads(lines[0])
+        if header.get('config_hash') != self.config_hash:
+            raise ValueError(f"نقطة الحفظ {self.path} تخص إعدادات بحث مختلفة")
+
+        valid_bytes = len(lines[0].encode('utf-8')) + 1
+        for line in lines[1:-1]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            self.completed[record['interval']] = record['zeros']
+            valid_bytes += len(line.encode('utf-8')) + 1
+
+        # حذف أي بقايا مبتورة حتى تبدأ الإضافات الجديدة بسطر سليم
+        with open(self.path, 'r+b') as f:
+            f.truncate(valid_bytes)
+        return True
+
+    def _write(self, lines: List[str]):
+        self._file.write(''.join(line + '\n' for line in lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_flush = time.monotonic()
+
+    def record(self, interval: int, zeros: List[float]):
+        """تسجيل فترة مكتملة (تُكتب عند انقضاء الفاصل الزمني)
+
+        completed يبقى ما قُرئ من السجل فقط، فلا تتراكم الأصفار في الذاكرة.
+        """
+        self._pending.append(json.dumps({'interval': interval, 'zeros': list(zeros)}))
+        if time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """كتابة السجلات المعلقة على القرص"""
+        if self._pending:
+            self._write(self._pending)
+            self._pending = []
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
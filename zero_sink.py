@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+مصارف الأصفار: كتابة الأصفار تدريجياً أثناء البحث
+Zero sinks: incremental output for the zero search
+
+يكتب الباحث الأصفار دفعةً بعد دفعة (مرتبة تصاعدياً) في مصرف، فلا تكبر
+الذاكرة مع عدد الأصفار:
+- ListSink: قائمة في الذاكرة (السلوك القديم لـ find_critical_zeros).
+- JSONLinesSink: صفر واحد لكل سطر كرقم JSON.
+- BinarySink: float64 خام little-endian قابل للإلحاق ويُقرأ بـ np.memmap.
+Zeros are written batch by batch, in ascending order, to an in-memory
+list, a newline-delimited JSON file, or an appendable raw float64 file.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from typing import List, Union
+
+import numpy as np
+
+# ترتيب البايتات ونوع عناصر الملف الثنائي
+BINARY_DTYPE = np.dtype('<f8')
+
+
+class ZeroSink(ABC):
+    """واجهة المصرف: write(دفعة مرتبة)، flush، close، count"""
+
+    count = 0
+
+    @abstractmethod
+    def write(self, zeros: np.ndarray):
+        """إضافة دفعة أصفار مرتبة تصاعدياً"""
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ListSink(ZeroSink):
+    """مصرف في الذاكرة - In-memory sink (backward-compatible list)"""
+
+    def __init__(self):
+        self.zeros: List[float] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.zeros)
+
+    def write(self, zeros: np.ndarray):
+        self.zeros.extend(np.asarray(zeros, dtype=np.float64).tolist())
+
+
+class _FileSink(ZeroSink):
+    """أساس المصارف الملفية: عدّاد فقط، والأصفار على القرص"""
+
+    binary = False
+
+    def __init__(self, path: str, append: bool = False):
+        self.path = path
+        self.written = 0
+        mode = ('a' if append else 'w') + ('b' if self.binary else '')
+        self._file = open(path, mode, encoding=None if self.binary else 'utf-8')
+
+    @property
+    def count(self) -> int:
+        """عدد الأصفار المكتوبة عبر هذا المصرف"""
+        return self.written
+
+    def write(self, zeros: np.ndarray):
+        zeros = np.asarray(zeros, dtype=np.float64)
+        self._write(zeros)
+        self.written += len(zeros)
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class JSONLinesSink(_FileSink):
+    """صفر لكل سطر (رقم JSON) - Newline-delimited JSON sink"""
+
+    def _write(self, zeros: np.ndarray):
+        # repr يعيد أقصر تمثيل عشري يُسترجع منه float64 نفسه
+        self._file.write(''.join(f'{z!r}\n' for z in zeros.tolist()))
+
+
+class BinarySink(_FileSink):
+    """float64 خام قابل للإلحاق - Appendable raw little-endian float64 sink"""
+
+    binary = True
+
+    def _write(self, zeros: np.ndarray):
+        self._file.write(zeros.astype(BINARY_DTYPE, copy=False).tobytes())
+
+
+def open_sink(path: str, append: bool = False) -> Union[JSONLinesSink, BinarySink]:
+    """مصرف ملفي حسب الامتداد: .jsonl/.ndjson نصي، وغير ذلك ثنائي"""
+    if path.endswith(('.jsonl', '.ndjson')):
+        return JSONLinesSink(path, append)
+    return BinarySink(path, append)
+
+
+def load_zeros(path: str) -> np.ndarray:
+    """قراءة ملف أصفار: الثنائي يُربط بالذاكرة (memmap) دون نسخ، والنصي يُحلل"""
+    if path.endswith(('.jsonl', '.ndjson')):
+        with open(path, 'r', encoding='utf-8') as f:
+            return np.fromiter((float(line) for line in f if line.strip()),
+                               dtype=np.float64)
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=np.float64)
+    return np.memmap(path, dtype=BINARY_DTYPE, mode='r')